@@ -19,7 +19,9 @@ if TYPE_CHECKING:
 
 
 CANONICAL_DUMP_GLOB = "musicbrainz-canonical-dump-*/"
-CANONICAL_RELEASE_FILE_NAME = "preprocessed_release_redirect.csv"
+CANONICAL_RELEASE_FILE_NAME = "preprocessed_release_redirect.pkl"
+CANONICAL_DATA_READY_FILE_NAME = "READY"
+CSV_CHUNK_SIZE = 1_000_000  # Rows
 
 
 # === Exceptions === #
@@ -82,6 +84,9 @@ def preprocess_csv(
     """
     Preprocess a canonical data csv file.
 
+    The preprocessed data is saved as a pickle file, which is loaded much
+    faster than a csv file since it doesn't need to be parsed.
+
     Args:
         file_path (Path): The path to the canonical data csv file.
         save_path (Path): The path to save the preprocessed data.
@@ -96,15 +101,20 @@ def preprocess_csv(
     if keep_columns is not None:
         keep_columns = list(keep_columns)
 
-    df = pd.read_csv(
+    # Read by chunks to avoid holding the whole parsed file in memory
+    # MBIDs are kept as plain python strings, faster to parse than the string dtype
+    chunks = pd.read_csv(
         file_path,
-        dtype="string",
+        dtype=str,
+        na_filter=False,
         usecols=keep_columns,
+        chunksize=CSV_CHUNK_SIZE,
     )
+    df = pd.concat((chunk.drop_duplicates() for chunk in chunks), ignore_index=True)
 
-    df.drop_duplicates(inplace=True)
+    df.drop_duplicates(inplace=True, ignore_index=True)
 
-    df.to_csv(save_path, index=False)
+    df.to_pickle(save_path)
 
     logger.info(f"Saved preprocessed data to {save_path}.")
 
@@ -160,6 +170,10 @@ def preprocess_canonical_recording_data(file_path: Path, save_path: Path) -> pd.
 
 def update_canonical_data(data_dir: Path, keep_original: bool = False) -> pd.DataFrame:
     """TODO."""
+    # The data is incomplete until the update succeeds
+    ready_path = data_dir / CANONICAL_DATA_READY_FILE_NAME
+    ready_path.unlink(missing_ok=True)
+
     # Download and decompress
     temp_dir = data_dir / "temp"
     compressed_data = download_and_validate_canonical_data(temp_dir)
@@ -196,11 +210,27 @@ def update_canonical_data(data_dir: Path, keep_original: bool = False) -> pd.Dat
         shutil.rmtree(old_dump)
     logger.info(f"Deleted old canonical data dumps.")
 
+    # Mark the canonical data as complete
+    ready_path.touch()
+
     logger.success("Canonical data downloaded and preprocessed with success!")
 
     return preprocessed_release_df
 
 
+def is_canonical_data_ready(data_dir: Path) -> bool:
+    """
+    Check if the canonical data in the data directory has been completely downloaded and preprocessed.
+
+    Args:
+        data_dir (Path): The path to the data directory.
+
+    Returns:
+        bool: True if the canonical data is ready to be used, False otherwise.
+    """
+    return (data_dir / CANONICAL_DATA_READY_FILE_NAME).exists()
+
+
 def get_csv_dir(extracted_data_dir: Path) -> Path:
     """
     Return the path to the directory containing the canonical data csv files.
@@ -214,8 +244,8 @@ def get_csv_dir(extracted_data_dir: Path) -> Path:
     return extracted_data_dir / "canonical"
 
 
-def get_last_canonical_release_csv_path(data_dir: Path) -> Path:
-    """Return the path to the last canonical release data csv."""
+def get_last_canonical_release_path(data_dir: Path) -> Path:
+    """Return the path to the last preprocessed canonical release data."""
     last_dump_dir = max(data_dir.glob(CANONICAL_DUMP_GLOB), default=None)
     if last_dump_dir is None:
         raise MissingCanonicalDataError(data_dir)
@@ -226,8 +256,8 @@ def get_last_canonical_release_csv_path(data_dir: Path) -> Path:
 
 def replace_canonical_release_data(data_frame: pd.DataFrame, data_dir: Path) -> None:
     """Replace the last canonical release data with the dataframe."""
-    canonical_release_path = get_last_canonical_release_csv_path(data_dir)
-    return data_frame.to_csv(canonical_release_path, index=False)
+    canonical_release_path = get_last_canonical_release_path(data_dir)
+    return data_frame.to_pickle(canonical_release_path)
 
 
 # TODO: Make the data dir store only one data dump and simplify
@@ -244,42 +274,38 @@ def load_canonical_release_data(data_dir: Path) -> pd.DataFrame:
     Raises:
         MissingCanonicalDataError: If no canonical data is found in the data directory.
     """
-    canonical_release_path = get_last_canonical_release_csv_path(data_dir)
-    return pd.read_csv(canonical_release_path)
+    canonical_release_path = get_last_canonical_release_path(data_dir)
+    if not canonical_release_path.exists():
+        # Also happens with data preprocessed by older versions, saved as csv
+        raise MissingCanonicalDataError(data_dir)
+
+    return pd.read_pickle(canonical_release_path)  # noqa: S301
 
 
 # === Compute mapping === #
-def get_release_group_to_release_map(
-    release_group_mbids: Sequence[str], canonical_release_df: pd.DataFrame
-) -> dict[MBID, MBID]:
+def get_release_group_to_release_lookup(canonical_release_df: pd.DataFrame) -> dict[MBID, MBID]:
     """
-    Return a map of release group MBIDs to their canonical release MBIDs.
+    Return a lookup table of every release group MBID to its canonical release MBID.
+
+    Building the dictionary once allows constant time lookups instead of
+    filtering the whole DataFrame for each set of release groups.
 
     Args:
-        release_group_mbids (set[str]): A set of release group MBIDs to map.
         canonical_release_df (pd.DataFrame): The DataFrame containing the
             canonical release mappings.
 
     Returns:
-        dict[MBID, MBID]: A dictionary mapping release group MBIDs to their
-            canonical release MBIDs.
+        dict[MBID, MBID]: A dictionary mapping every release group MBID to its
+            canonical release MBID.
     """
-    # Filter rows to keep only the necessary release group mbids
-    filtered_df = canonical_release_df[
-        canonical_release_df[CanonicalDataHeader.RELEASE_GROUP_MBID].isin(release_group_mbids)
-    ]
-
-    # Convert to a dictionary
-    canonical_release_mapping = dict(
+    return dict(
         zip(
-            filtered_df[CanonicalDataHeader.RELEASE_GROUP_MBID],
-            filtered_df[CanonicalDataHeader.CANONICAL_RELEASE_MBID],
+            canonical_release_df[CanonicalDataHeader.RELEASE_GROUP_MBID].to_numpy(),
+            canonical_release_df[CanonicalDataHeader.CANONICAL_RELEASE_MBID].to_numpy(),
             strict=True,
         )
     )
 
-    return canonical_release_mapping
-
 
 # TODO: Return only a list if the mapping is not used?
 # Note: Not used anymore
@@ -6,6 +6,8 @@ Temporary config module for MusicBrainz2notion.
 
 from __future__ import annotations
 
+from functools import cache
+
 import attrs
 import typed_settings as ts
 from notion_client import Client
@@ -74,6 +76,12 @@ class Settings:
         add_track_thumbnail: Whether to add a thumbnail to tracks.
         force_update_artist_cover: Whether to force the update the MusicBrainz
             canonical data, effectively downloading the data again.
+        use_cache: Whether to cache MusicBrainz responses and cover URLs on
+            disk between runs.
+        clear_cache: Whether to clear the caches before synchronizing,
+            effectively fetching up to date data.
+        mb_cache_expiration_days: Number of days MusicBrainz responses are
+            kept in the cache before being fetched again.
     """
 
     artists_to_update: tuple[str, ...] = ()
@@ -118,6 +126,30 @@ class Settings:
     add_track_thumbnail: bool = True  # TODO: Remove this because their is no image copy anyway
     force_update_canonical_data: bool = False
 
+    # === Cache === #
+    use_cache: bool = True
+    clear_cache: bool = False
+    mb_cache_expiration_days: int = 7
+
+
+@cache
+def load_settings() -> Settings:
+    """
+    Load the settings from the configuration file.
+
+    The settings are loaded on the first call only, so that importing the app
+    doesn't parse the configuration file.
+
+    Returns:
+        Settings: The loaded settings.
+    """
+    return ts.load(
+        Settings,
+        appname=__app_name__,
+        config_files=[CONFIG_PATH],
+        env_prefix=None,
+    )
+
 
 @attrs.define(
     kw_only=True,
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import StrEnum
-from functools import partial
+from functools import cache, partial
 from typing import TYPE_CHECKING, Any, ClassVar, override
 
 from loguru import logger
 
 from musicbrainz2notion.__about__ import __app_name__, __author_email__, __version__
 from musicbrainz2notion.config import global_settings
+from musicbrainz2notion.keyed_lock import KeyedLock
 from musicbrainz2notion.musicbrainz_data_retrieval import (
     fetch_artist_data,
     fetch_recording_data,
@@ -28,7 +31,9 @@ from musicbrainz2notion.musicbrainz_utils import (
     TagDict,
 )
 from musicbrainz2notion.notion_utils import (
+    DatabaseId,
     NotionResponse,
+    PageId,
     PropertyField,
     PropertyType,
     format_checkbox,
@@ -115,6 +120,52 @@ class TrackDBProperty(StrEnum):
 
 
 type NotionBDProperty = ArtistDBProperty | ReleaseDBProperty | TrackDBProperty
+# Page ID and content hash of each synchronized page, by database ID and MBID
+type SyncHashes = dict[DatabaseId, dict[MBID, tuple[PageId, str]]]
+
+# Each entity type has a single icon, so its payload is built once and shared;
+# it must not be modified
+_format_icon = cache(format_emoji)
+
+
+def _deep_get(data: MBDataDict, *keys: str, default: Any = None) -> Any:
+    """
+    Return the value at the given nested keys of a MusicBrainz data dictionary.
+
+    Args:
+        data (MBDataDict): The MusicBrainz data dictionary.
+        *keys (str): The successive keys leading to the value.
+        default (Any): The value returned if any of the keys is missing.
+
+    Returns:
+        Any: The nested value, or the default value if any of the keys is
+            missing.
+    """
+    try:
+        for key in keys:
+            data = data[key]
+    except (KeyError, TypeError):
+        return default
+    return data
+
+
+# Prevent concurrent synchronizations of the same entity from creating duplicate pages
+_page_locks: KeyedLock[MBID] = KeyedLock()
+
+
+def _content_hash(page_content: dict[str, Any]) -> str:
+    """
+    Return a hash of the content of a Notion page.
+
+    Args:
+        page_content (dict[str, Any]): The properties and icon of the page, as
+            sent to the Notion API.
+
+    Returns:
+        str: The hexadecimal digest of the page content.
+    """
+    serialized_content = json.dumps(page_content, sort_keys=True).encode()
+    return hashlib.blake2b(serialized_content, digest_size=16).hexdigest()
 
 
 # %% === Database Entities === #
@@ -132,7 +183,7 @@ class MusicBrainzEntity(ABC):
     @property
     def mb_url(self) -> str:
         """MusicBrainz URL of the entity."""
-        return str(BASE_MUSICBRAINZ_URL / self.entity_type.value / self.mbid)
+        return f"{BASE_MUSICBRAINZ_URL}/{self.entity_type.value}/{self.mbid}"
 
     @abstractmethod
     def to_page_properties(
@@ -157,7 +208,9 @@ class MusicBrainzEntity(ABC):
         mbid_to_page_id_map: dict[str, str],
         min_nb_tags: int,
         fanart_api_key: str | None,
-    ) -> NotionResponse:
+        *,
+        content_hashes: SyncHashes | None = None,
+    ) -> NotionResponse | None:
         """
         Update the entity's page in the Notion database.
 
@@ -173,9 +226,26 @@ class MusicBrainzEntity(ABC):
             min_nb_tags (int): Minimum number of tags to be added to the
                 missing related pages.
             fanart_api_key (str | None): Fanart.tv API key.
+            content_hashes (SyncHashes | None): Hashes of the content of the
+                pages at their last synchronization. If the page exists with
+                the same page ID and its content hash is unchanged, the update
+                is skipped. The hash of the synchronized content is stored in
+                the mapping.
+
+        Returns:
+            NotionResponse | None: The response of the Notion API, or None if
+                the page was unchanged and the update was skipped.
         """
-        logger.debug(f"Synchronizing {self.str_colored} page in Notion.")
+        logger.debug(
+            "Synchronizing {cls} <green>{name}</green> <dim>(MBID {mbid})</dim> page in Notion.",
+            cls=self.__class__.__name__,
+            name=self.name,
+            mbid=self.mbid,
+        )
         database_id = database_ids[self.entity_type]
+        database_hashes = (
+            None if content_hashes is None else content_hashes.setdefault(database_id, {})
+        )
 
         self._add_missing_related_pages(
             notion_api=notion_api,
@@ -185,37 +255,56 @@ class MusicBrainzEntity(ABC):
             fanart_api_key=fanart_api_key,
         )
 
-        if self.mbid in mbid_to_page_id_map:
-            # The page already exists in the database
-            logger.info(f"{self.str_colored} found in Notion, updating page.")
-            page_id = mbid_to_page_id_map[self.mbid]
-
-            try:
-                response: Any = notion_api.pages.update(
-                    page_id=page_id,
-                    properties=self.to_page_properties(mbid_to_page_id_map),
-                    icon=format_emoji(self.icon),
-                )
-            except Exception:
-                logger.exception(f"Error updating {self.str_colored}'s page in Notion")
-                raise
-
-        else:
-            # Create new page in the database
-            logger.info(f"{self.str_colored} not found in Notion, creating new page.")
-
-            try:
-                response = notion_api.pages.create(
-                    parent={"database_id": database_id},
-                    properties=self.to_page_properties(mbid_to_page_id_map),
-                    icon=format_emoji(self.icon),
-                )
-            except Exception:
-                logger.exception(f"Error creating {self.str_colored}'s page in Notion")
-                raise
+        properties = self.to_page_properties(mbid_to_page_id_map)
+        icon = _format_icon(self.icon)
+        content_hash = _content_hash({"properties": properties, "icon": icon})
+
+        with _page_locks.hold(self.mbid):
+            page_id = mbid_to_page_id_map.get(self.mbid)
+            if page_id is not None:
+                # The page already exists in the database, the hash is only valid for the
+                # same page since the previous one may have been deleted and recreated
+                if database_hashes is not None and database_hashes.get(self.mbid) == (
+                    page_id,
+                    content_hash,
+                ):
+                    logger.info(
+                        f"{self.str_colored} unchanged since last synchronization, skipping."
+                    )
+                    return None
+
+                logger.info(f"{self.str_colored} found in Notion, updating page.")
+
+                try:
+                    response: Any = notion_api.pages.update(
+                        page_id=page_id,
+                        properties=properties,
+                        icon=icon,
+                    )
+                except Exception:
+                    logger.exception(f"Error updating {self.str_colored}'s page in Notion")
+                    raise
 
             else:
-                mbid_to_page_id_map[self.mbid] = response[PropertyField.ID]
+                # Create new page in the database
+                logger.info(f"{self.str_colored} not found in Notion, creating new page.")
+
+                try:
+                    response = notion_api.pages.create(
+                        parent={"database_id": database_id},
+                        properties=properties,
+                        icon=icon,
+                    )
+                except Exception:
+                    logger.exception(f"Error creating {self.str_colored}'s page in Notion")
+                    raise
+
+                else:
+                    page_id = response[PropertyField.ID]
+                    mbid_to_page_id_map[self.mbid] = page_id
+
+            if database_hashes is not None:
+                database_hashes[self.mbid] = (page_id, content_hash)
 
         return response
 
@@ -442,7 +531,7 @@ class Artist(MusicBrainzEntity):
             name=artist_data["name"],
             aliases=[alias_info["alias"] for alias_info in artist_data.get("alias-list", [])],
             type=artist_data.get("type"),
-            area=artist_data.get("area", {}).get("name"),
+            area=_deep_get(artist_data, "area", "name"),
             start_year=get_start_year(artist_data),
             tags=cls._select_tags(tag_list, min_nb_tags),
             thumbnail=fetch_artist_thumbnail(artist_data, fanart_api_key),
@@ -547,7 +636,7 @@ class Release(MusicBrainzEntity):
             type=release_group_data.get("type"),
             first_release_year=first_release_year,
             tags=cls._select_tags(tag_list, min_nb_tags),
-            language=release_data.get("text-representation", {}).get("language"),
+            language=_deep_get(release_data, "text-representation", "language"),
             thumbnail=get_release_group_cover_url(release_group_data["id"], cover_size),
             rating=get_rating(release_group_data),
         )
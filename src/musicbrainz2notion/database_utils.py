@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import json
+from concurrent.futures import ThreadPoolExecutor
+from itertools import batched
 from typing import TYPE_CHECKING, Any
 
+import attrs
 import pandas as pd
 from loguru import logger
 
@@ -12,7 +16,7 @@ from musicbrainz2notion.__about__ import (
     __repo_url__,
 )
 from musicbrainz2notion.canonical_data_processing import (
-    get_release_group_to_release_map,
+    get_release_group_to_release_lookup,
     load_canonical_release_data,
     replace_canonical_release_data,
     update_canonical_data,
@@ -30,16 +34,27 @@ from musicbrainz2notion.notion_utils import (
     PropertyType,
     extract_plain_text,
     get_checkbox_value,
+    get_database_property_id,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from pathlib import Path
 
     from notion_client import Client
 
+    from musicbrainz2notion.database_entities import SyncHashes
     from musicbrainz2notion.musicbrainz_utils import MBID, EntityType
 
 DATA_DIR = PROJECT_ROOT / "data"
+SYNC_HASHES_PATH = DATA_DIR / "sync_hashes.json"
+NOTION_MAX_WORKERS = 3  # Notion API allows an average of 3 requests per second
+NOTION_FILTER_MAX_CONDITIONS = 100
+
+# Plain string keys, faster to access than enum members when parsing many pages
+_MBID_PROPERTY_KEY = str(ArtistDBProperty.MBID)
+_RICH_TEXT_KEY = str(PropertyType.RICH_TEXT)
+_ID_KEY = str(PropertyField.ID)
 
 
 # %% === Processing Notion data == #
@@ -66,9 +81,7 @@ def get_page_mbid(page_result: dict[str, Any]) -> MBID:
     Returns:
         MBID: The MBID from the page.
     """
-    return extract_plain_text(
-        page_result["properties"][ArtistDBProperty.MBID][PropertyType.RICH_TEXT]
-    )
+    return extract_plain_text(page_result["properties"][_MBID_PROPERTY_KEY][_RICH_TEXT_KEY])
 
 
 def get_page_name(page_result: dict[str, Any]) -> str:
@@ -96,22 +109,33 @@ def get_page_id(page_result: dict[str, Any]) -> PageId:
     Returns:
         PageId: The unique page ID from the page result.
     """
-    return page_result[PropertyField.ID]
+    return page_result[_ID_KEY]
 
 
 # TODO: use iterate_paginated_api instead of handle pagination manually
-def compute_mbid_to_page_id_map(notion_api: Client, database_id: str) -> dict[MBID, PageId]:
+def scan_database(
+    notion_api: Client, database_id: str, query_filter: dict[str, Any] | None = None
+) -> dict[MBID, PageId]:
     """
-    Compute the mapping of MBIDs to Notion page IDs for a given database.
+    Compute the mapping of MBIDs to Notion page IDs of the pages of a database.
+
+    Only the mbid property of the pages is retrieved to reduce the size of the
+    responses.
 
     Args:
         notion_api (Client): Notion API client.
         database_id (str): The ID of the database in Notion.
+        query_filter (dict[str, Any] | None): Notion filter selecting the pages
+            to scan. If None, all pages of the database are scanned.
 
     Returns:
-        dict[MBID, PageId]: Mapping of MBIDs to their Notion page IDs.
+        dict[MBID, PageId]: Mapping of the MBIDs of the scanned pages to their
+            Notion page IDs.
     """
-    logger.info(f"Computing MBID to page ID mapping for database {database_id}")
+    mbid_property_id = get_database_property_id(notion_api, database_id, ArtistDBProperty.MBID)
+    query_kwargs: dict[str, Any] = {"filter_properties": [mbid_property_id]}
+    if query_filter is not None:
+        query_kwargs["filter"] = query_filter
 
     mbid_to_page_id_map: dict[MBID, PageId] = {}
     has_more = True
@@ -119,83 +143,80 @@ def compute_mbid_to_page_id_map(notion_api: Client, database_id: str) -> dict[MB
 
     # Process paginated results
     while has_more:
-        logger.debug(f"Querying database {database_id} with start_cursor={start_cursor}")
+        logger.debug(
+            "Querying database {database_id} with start_cursor={start_cursor}",
+            database_id=database_id,
+            start_cursor=start_cursor,
+        )
         try:
             query: Any = notion_api.databases.query(
-                database_id=database_id, start_cursor=start_cursor
+                database_id=database_id, start_cursor=start_cursor, **query_kwargs
             )
         except Exception:
-            logger.exception(
-                f"Error querying database {database_id} to compute MBID to page ID mapping."
-            )
+            logger.exception(f"Error querying database {database_id}.")
             raise
 
-        new_id_maps = {
-            get_page_mbid(page_result): get_page_id(page_result) for page_result in query["results"]
-        }
-        mbid_to_page_id_map.update(new_id_maps)
+        mbid_to_page_id_map.update(
+            (get_page_mbid(page_result), get_page_id(page_result))
+            for page_result in query["results"]
+        )
 
         # Pagination control
         has_more = query["has_more"]
         start_cursor = query["next_cursor"]
 
-    logger.info(f"Computed mapping for {len(mbid_to_page_id_map)} entries.")
-
     return mbid_to_page_id_map
 
 
-# TODO: use iterate_paginated_api instead of handle pagination manually
-def fetch_artists_to_update(
-    notion_api: Client, artist_db_id: str
-) -> tuple[list[MBID], dict[MBID, PageId]]:
+def compute_mbid_to_page_id_map(notion_api: Client, database_id: str) -> dict[MBID, PageId]:
     """
-    Retrieve the list of artists to update in the Notion database.
-
-    Also returns a mapping of artist MBIDs to their Notion page IDs.
+    Compute the mapping of MBIDs to Notion page IDs for a given database.
 
     Args:
         notion_api (Client): Notion API client.
-        artist_db_id (str): The ID of the artist database in Notion.
+        database_id (str): The ID of the database in Notion.
 
     Returns:
-        list[MBID]: List of artist MBIDs to update.
-        dict[MBID, PageId]: Mapping of artist MBIDs to their Notion page IDs.
+        dict[MBID, PageId]: Mapping of MBIDs to their Notion page IDs.
     """
-    logger.info(f"Fetching artists to update from database {artist_db_id}")
+    logger.info(f"Computing MBID to page ID mapping for database {database_id}")
 
-    to_update_mbids: list[MBID] = []
-    mbid_to_page_id_map: dict[MBID, PageId] = {}
+    mbid_to_page_id_map = scan_database(notion_api, database_id)
 
-    has_more = True
-    start_cursor = None
+    logger.info(f"Computed mapping for {len(mbid_to_page_id_map)} entries.")
 
-    while has_more:
-        logger.debug(f"Querying artist database {artist_db_id} with start_cursor={start_cursor}")
+    return mbid_to_page_id_map
 
-        try:
-            query: Any = notion_api.databases.query(
-                database_id=artist_db_id, start_cursor=start_cursor
-            )
-        except Exception:
-            logger.exception(f"Error fetching artist data from database {artist_db_id}")
-            raise
 
-        for artist_result in query["results"]:
-            mbid = get_page_mbid(artist_result)
-            mbid_to_page_id_map[mbid] = get_page_id(artist_result)
+def fetch_artists_to_update(notion_api: Client, artist_db_id: str) -> dict[MBID, PageId]:
+    """
+    Retrieve the artists to update in the Notion database.
 
-            if is_page_marked_for_update(artist_result):
-                to_update_mbids.append(mbid)
+    Only the pages with the 'To update' property checked are queried, the
+    filtering being done by Notion.
 
-        # Pagination control
-        has_more = query["has_more"]
-        start_cursor = query["next_cursor"]
+    Args:
+        notion_api (Client): Notion API client.
+        artist_db_id (str): The ID of the artist database in Notion.
+
+    Returns:
+        dict[MBID, PageId]: Mapping of the MBIDs of the artists to update to
+            their Notion page IDs.
+    """
+    logger.info(f"Fetching artists to update from database {artist_db_id}")
 
-    logger.info(
-        f"Found {len(to_update_mbids)} artists to update and computed mapping for {len(mbid_to_page_id_map)} entries."
+    to_update_mbid_to_page_id_map = scan_database(
+        notion_api,
+        artist_db_id,
+        query_filter={
+            "property": ArtistDBProperty.TO_UPDATE,
+            PropertyType.CHECKBOX: {"equals": True},
+        },
     )
 
-    return to_update_mbids, mbid_to_page_id_map
+    logger.info(f"Found {len(to_update_mbid_to_page_id_map)} artists to update.")
+
+    return to_update_mbid_to_page_id_map
 
 
 def move_to_trash_outdated_entity_pages(
@@ -225,123 +246,235 @@ def move_to_trash_outdated_entity_pages(
 
     logger.info(f"Moving out of date {entity_type}s to trash.")
 
-    # Construct the filter to query for pages related to the updated artists
-    query_filter = {
-        "or": [
-            {"property": artist_property, "relation": {"contains": artist_page_id}}
-            for artist_page_id in artist_page_ids
-        ]
-    }
-
-    # Query the Notion database for the pages related to the updated artists
-    pages: Any = notion_api.databases.query(database_id=database_id, filter=query_filter)
-
-    # Loop through the results and move outdated pages to the trash
-    for page in pages["results"]:
-        page_id = get_page_id(page)
-        if page_id not in updated_entity_page_ids:
-            logger.info(f"Moving {entity_type} {page_id} to trash.")
-            notion_api.pages.update(page_id=page_id, archived=True)
+    def fetch_outdated_pages(artist_page_ids_chunk: tuple[PageId, ...]) -> dict[PageId, str]:
+        # Construct the filter to query for pages related to the artists of the chunk
+        query_filter = {
+            "or": [
+                {"property": artist_property, "relation": {"contains": artist_page_id}}
+                for artist_page_id in artist_page_ids_chunk
+            ]
+        }
 
-    has_more = True
-    start_cursor = None
+        chunk_outdated_pages: dict[PageId, str] = {}
+        has_more = True
+        start_cursor = None
 
-    # Loop through paginated results
-    while has_more:
-        try:
+        # Loop through paginated results
+        while has_more:
             # Query the Notion database for the pages related to the updated artists
             pages_response: Any = notion_api.databases.query(
                 database_id=database_id, filter=query_filter, start_cursor=start_cursor
             )
+
+            for page in pages_response["results"]:
+                page_id = get_page_id(page)
+                if page_id not in updated_entity_page_ids:
+                    chunk_outdated_pages[page_id] = get_page_name(page)
+
+            # Check if there are more pages to retrieve
+            has_more = pages_response.get("has_more", False)
+            start_cursor = pages_response.get("next_cursor", None)
+
+        return chunk_outdated_pages
+
+    # Collect the outdated pages before moving them to trash to keep the pagination stable.
+    # Artists are queried by chunks since Notion limits the number of conditions of a filter.
+    outdated_pages: dict[PageId, str] = {}
+    with ThreadPoolExecutor(max_workers=NOTION_MAX_WORKERS) as executor:
+        try:
+            for chunk_outdated_pages in executor.map(
+                fetch_outdated_pages,
+                batched(artist_page_ids, NOTION_FILTER_MAX_CONDITIONS),  # noqa: B911
+            ):
+                outdated_pages.update(chunk_outdated_pages)
         except Exception as e:
             logger.warning(f"Error querying Notion database {database_id}: {e}")
             return
 
-        # Loop through the results and move outdated pages to the trash
-        for page in pages_response["results"]:
-            page_id = get_page_id(page)
-            if page_id not in updated_entity_page_ids:
-                page_name = get_page_name(page)
-                logger.info(f"Moving {entity_type} {page_name} to trash.")
-                notion_api.pages.update(page_id=page_id, archived=True)
+    def move_to_trash(page_id: PageId) -> None:
+        logger.info(f"Moving {entity_type} {outdated_pages[page_id]} to trash.")
+        notion_api.pages.update(page_id=page_id, archived=True)
+
+    with ThreadPoolExecutor(max_workers=NOTION_MAX_WORKERS) as executor:
+        _ = list(executor.map(move_to_trash, outdated_pages))
+
+
+# %% === Synchronization hashes === #
+def load_sync_hashes(path: Path = SYNC_HASHES_PATH) -> SyncHashes:
+    """
+    Load the content hashes of the pages from their last synchronization.
+
+    Args:
+        path (Path): The path to the json file containing the hashes.
+
+    Returns:
+        SyncHashes: A dictionary mapping database IDs to the page ID and
+            content hash of each of their synchronized pages by MBID, empty if
+            no hashes were saved yet or if they can't be read.
+    """
+    if not path.exists():
+        return {}
+
+    try:
+        with path.open(encoding="utf-8") as f:
+            saved_hashes = json.load(f)
+        # Json has no tuples, the page IDs and hashes are saved as lists
+        return {
+            database_id: {
+                mbid: (page_id, content_hash)
+                for mbid, (page_id, content_hash) in database_hashes.items()
+            }
+            for database_id, database_hashes in saved_hashes.items()
+        }
+    except (OSError, ValueError, TypeError, AttributeError):
+        logger.warning(f"Could not read synchronization hashes from {path}, ignoring them.")
+        return {}
+
+
+def save_sync_hashes(content_hashes: SyncHashes, path: Path = SYNC_HASHES_PATH) -> None:
+    """
+    Save the content hashes of the synchronized pages.
+
+    Args:
+        content_hashes (SyncHashes): A dictionary mapping database IDs to the
+            page ID and content hash of each of their synchronized pages by
+            MBID.
+        path (Path): The path to the json file where the hashes are saved.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(content_hashes, f)
+
 
-        # Check if there are more pages to retrieve
-        has_more = pages_response.get("has_more", False)
-        start_cursor = pages_response.get("next_cursor", None)
+@attrs.define
+class CanonicalReleaseLookup:
+    """
+    Canonical releases of the release groups, shared by the lookups of a run.
+
+    Attributes:
+        releases: A mapping of release group MBIDs to the MBID of their
+            canonical release.
+        is_updated: Whether the canonical data has already been updated
+            during the run.
+        fallback_releases: The releases chosen for the release groups missing
+            in the canonical data, not saved in the canonical data yet.
+    """
+
+    releases: dict[MBID, MBID]
+    is_updated: bool = False
+    fallback_releases: dict[MBID, MBID] = attrs.field(factory=dict)
 
 
 def get_release_map_with_auto_update(
-    release_group_mbids: list[MBID],
+    release_group_mbids: Sequence[MBID],
     data_dir: Path,
-    canonical_release_df: pd.DataFrame | None = None,
+    canonical_release_lookup: CanonicalReleaseLookup | None = None,
 ) -> dict[MBID, MBID]:
     """
     Return a mapping from release-group MBID -> canonical release MBID and update the canonical release data if needed.
 
     If any release group MBIDs are missing, automatically update
     the canonical data by:
-        1. Calling `update_canonical_data` to fetch & merge new data.
+        1. Calling `update_canonical_data` to fetch new data, if it hasn't
+            been done yet with this lookup.
         2. If any MBIDs are still missing, fetch their first release from
-            MusicBrainz and append the first to our canonical data as a fallback.
-    """
-    if canonical_release_df is None:
-        canonical_release_df = load_canonical_release_data(data_dir)
+            MusicBrainz as a fallback. The fallback releases are added to the
+            canonical data with `save_fallback_canonical_releases`.
 
-    mbids_map = get_release_group_to_release_map(release_group_mbids, canonical_release_df)
+    Args:
+        release_group_mbids (Sequence[MBID]): The release group MBIDs to map.
+        data_dir (Path): The path to the data directory.
+        canonical_release_lookup (CanonicalReleaseLookup | None): Canonical
+            releases shared by the calls of a run, updated in place. If None,
+            it is loaded from the data directory and the fallback releases are
+            saved before returning.
 
-    nb_missing_mbids = len(release_group_mbids) - len(mbids_map)
+    Returns:
+        dict[MBID, MBID]: A dictionary mapping the release group MBIDs to their
+            canonical release MBIDs.
+    """
+    is_single_lookup = canonical_release_lookup is None
+    if canonical_release_lookup is None:
+        canonical_release_lookup = CanonicalReleaseLookup(
+            get_release_group_to_release_lookup(load_canonical_release_data(data_dir))
+        )
+    releases = canonical_release_lookup.releases
+
+    mbids_map = {mbid: releases[mbid] for mbid in release_group_mbids if mbid in releases}
+    missing_mbids = set(release_group_mbids) - mbids_map.keys()
 
-    if not nb_missing_mbids:
+    if not missing_mbids:
         return mbids_map
 
-    # Update the canonical release data
-    logger.warning(
-        f"Some ({nb_missing_mbids}) release MBIDs are missing in the MusicBrainz canonical_data, updating the canonical data."
-    )
+    # The canonical data dump is heavy to download, so it is updated at most once per run
+    if not canonical_release_lookup.is_updated:
+        logger.warning(
+            f"Some ({len(missing_mbids)}) release MBIDs are missing in the MusicBrainz canonical_data, updating the canonical data."
+        )
 
-    updated_canonical_release_df = update_canonical_data(
-        data_dir=data_dir,
-        keep_original=False,
-    )
+        updated_canonical_release_df = update_canonical_data(
+            data_dir=data_dir,
+            keep_original=False,
+        )
+        releases.clear()
+        releases.update(get_release_group_to_release_lookup(updated_canonical_release_df))
+        canonical_release_lookup.is_updated = True
+        del updated_canonical_release_df
 
-    mbids_map = get_release_group_to_release_map(release_group_mbids, updated_canonical_release_df)
-    nb_missing_mbids = len(release_group_mbids) - len(mbids_map)
+        mbids_map = {mbid: releases[mbid] for mbid in release_group_mbids if mbid in releases}
+        missing_mbids = set(release_group_mbids) - mbids_map.keys()
 
-    if nb_missing_mbids:
-        missing_mbids = set(release_group_mbids) - set(mbids_map)
-        logger.error(
-            f"Some ({nb_missing_mbids}) release MBIDs are still missing in the MusicBrainz canonical data, canonical releases will be arbitrary chosen."
-        )
+        if not missing_mbids:
+            logger.info("Canonical data updated successfully.")
+            return mbids_map
 
-        # Chose the first release of the release group
-        missing_mbids_map = {
-            mbid: fetch_release_group_data(mbid)["release-list"][0]["id"]  # pyright: ignore[reportTypedDictNotRequiredAccess]
-            for mbid in missing_mbids
-        }  # TODO: Support missing mbid data
-        logger.debug(f"Missing mbids: {missing_mbids}")
+    logger.error(
+        f"Some ({len(missing_mbids)}) release MBIDs are still missing in the MusicBrainz canonical data, canonical releases will be arbitrary chosen."
+    )
 
-        mbids_map.update(missing_mbids_map)
+    # Chose the first release of the release group
+    missing_mbids_map = {
+        mbid: fetch_release_group_data(mbid)["release-list"][0]["id"]  # pyright: ignore[reportTypedDictNotRequiredAccess]
+        for mbid in missing_mbids
+    }  # TODO: Support missing mbid data
+    logger.debug("Missing mbids: {missing_mbids}", missing_mbids=missing_mbids)
 
-        # Update the canonical data
-        missing_data_rows = [
-            {
-                CanonicalDataHeader.RELEASE_GROUP_MBID: rg_mbid,
-                CanonicalDataHeader.CANONICAL_RELEASE_MBID: rel_mbid,
-            }
-            for rg_mbid, rel_mbid in missing_mbids_map.items()
-        ]
+    mbids_map.update(missing_mbids_map)
+    releases.update(missing_mbids_map)
+    canonical_release_lookup.fallback_releases.update(missing_mbids_map)
+
+    if is_single_lookup:
+        save_fallback_canonical_releases(canonical_release_lookup, data_dir)
+
+    return mbids_map
 
-        # Convert new rows to a DataFrame
-        missing_data_df = pd.DataFrame(missing_data_rows)
 
-        # Concatenate with updated canonical release DataFrame
-        updated_canonical_release_df = pd.concat(
-            [updated_canonical_release_df, missing_data_df], ignore_index=True
-        ).drop_duplicates(subset=["release_group_mbid"], keep="first")
+def save_fallback_canonical_releases(
+    canonical_release_lookup: CanonicalReleaseLookup, data_dir: Path
+) -> None:
+    """
+    Add the fallback releases of the lookup to the canonical data saved in the data directory.
 
-        replace_canonical_release_data(data_dir=data_dir, data_frame=updated_canonical_release_df)
+    Saving them once at the end of a run avoids rewriting the whole canonical
+    data for each lookup.
 
-    else:
-        logger.info("Canonical data updated successfully.")
+    Args:
+        canonical_release_lookup (CanonicalReleaseLookup): The canonical
+            releases of the run.
+        data_dir (Path): The path to the data directory.
+    """
+    fallback_releases = canonical_release_lookup.fallback_releases
+    if not fallback_releases:
+        return
 
-    return mbids_map
+    fallback_release_df = pd.DataFrame({
+        CanonicalDataHeader.RELEASE_GROUP_MBID: list(fallback_releases.keys()),
+        CanonicalDataHeader.CANONICAL_RELEASE_MBID: list(fallback_releases.values()),
+    })
+    canonical_release_df = pd.concat(
+        [load_canonical_release_data(data_dir), fallback_release_df], ignore_index=True
+    ).drop_duplicates(subset=[CanonicalDataHeader.RELEASE_GROUP_MBID], keep="first")
+
+    replace_canonical_release_data(data_frame=canonical_release_df, data_dir=data_dir)
+    fallback_releases.clear()
+    logger.info("Saved the fallback canonical releases.")
@@ -11,3 +11,4 @@ class EnvironmentVar(StrEnum):
     RELEASE_DB_ID = "MB2NT_RELEASE_DB_ID"
     TRACK_DB_ID = "MB2NT_TRACK_DB_ID"
     FANART_API_KEY = "MB2NT_FANART_API_KEY"
+    DEBUG = "MB2NT_DEBUG"
@@ -0,0 +1,46 @@
+"""Locks serializing the work done concurrently on the same key."""
+
+from __future__ import annotations
+
+from collections import Counter
+from contextlib import contextmanager
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterator
+
+
+class KeyedLock[K: Hashable]:
+    """
+    Thread-safe lock for each key, created on demand.
+
+    Threads holding different keys don't block each other. The lock of a key
+    is dropped as soon as no thread holds or waits for it, so that the number
+    of kept locks doesn't grow with the number of keys used during a run.
+    """
+
+    def __init__(self) -> None:
+        self._locks: dict[K, Lock] = {}
+        self._nb_users: Counter[K] = Counter()
+        self._guard = Lock()
+
+    @contextmanager
+    def hold(self, key: K) -> Iterator[None]:
+        """
+        Hold the lock of a key, waiting for the other threads holding it.
+
+        Args:
+            key (K): The key to lock.
+        """
+        with self._guard:
+            lock = self._locks.setdefault(key, Lock())
+            self._nb_users[key] += 1
+        try:
+            with lock:
+                yield
+        finally:
+            with self._guard:
+                self._nb_users[key] -= 1
+                if not self._nb_users[key]:
+                    del self._locks[key], self._nb_users[key]
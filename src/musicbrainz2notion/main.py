@@ -2,18 +2,19 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from functools import partial
+from itertools import batched
 from typing import TYPE_CHECKING, Annotated, cast
 
 import attrs
-import frosch  # pyright: ignore[reportMissingTypeStubs]
 import tomlkit
-import typed_settings as ts
 from cyclopts import App, Parameter
 from dotenv import load_dotenv
 from kajihs_utils.loguru import prompt, setup_logging
 from loguru import logger
-from notion_client import Client
-from toolz import dicttoolz  # pyright: ignore[reportMissingTypeStubs]
 
 from musicbrainz2notion.__about__ import (
     PROJECT_ROOT,
@@ -24,12 +25,15 @@ from musicbrainz2notion.__about__ import (
 )
 from musicbrainz2notion.canonical_data_processing import (
     MissingCanonicalDataError,
+    get_release_group_to_release_lookup,
+    is_canonical_data_ready,
     load_canonical_release_data,
     update_canonical_data,
 )
 from musicbrainz2notion.config import (
     CONFIG_PATH,
     Settings,
+    load_settings,
 )
 from musicbrainz2notion.database_entities import (
     Artist,
@@ -41,46 +45,59 @@ from musicbrainz2notion.database_entities import (
 )
 from musicbrainz2notion.database_utils import (
     DATA_DIR,
+    NOTION_MAX_WORKERS,
+    CanonicalReleaseLookup,
     compute_mbid_to_page_id_map,
     fetch_artists_to_update,
     get_release_map_with_auto_update,
+    load_sync_hashes,
     move_to_trash_outdated_entity_pages,
+    save_fallback_canonical_releases,
+    save_sync_hashes,
 )
 from musicbrainz2notion.environment import EnvironmentVar
 from musicbrainz2notion.musicbrainz_data_retrieval import (
     browse_release_groups_by_artist,
+    clear_musicbrainz_cache,
+    close_musicbrainz_client,
     extract_recording_mbids_and_track_number,
     fetch_artist_data,
     fetch_recording_data,
     fetch_release_data,
     initialize_musicbrainz_client,
 )
-from musicbrainz2notion.musicbrainz_utils import EntityType, MBDataDict
+from musicbrainz2notion.musicbrainz_utils import MBID, EntityType, MBDataDict
 from musicbrainz2notion.notion_utils import (
     OBJECT_ID_LENGTH,
+    PageId,
+    RateLimitedClient,
     extract_id_from_url,
     find_databases_with_properties,
     format_checkbox,
     is_valid_notion_key,
     is_valid_page_id,
 )
+from musicbrainz2notion.thumbnails_retrieval import (
+    COVER_URL_CACHE_EXPIRATION,
+    clear_cover_url_cache,
+    initialize_cover_url_cache,
+)
 
 if TYPE_CHECKING:
-    from tomlkit.container import Container as TomlkitContainer
+    from collections.abc import Iterable, Iterator
 
-try:
-    frosch.hook()  # enable frosch for easier debugging
+    from tomlkit.container import Container as TomlkitContainer
 
-    log_dir = PROJECT_ROOT / "logs"
-    setup_logging(log_dir=log_dir)
+    from musicbrainz2notion.database_entities import MusicBrainzEntity, SyncHashes
 
-    loaded_settings = ts.load(
-        Settings,
-        appname=__app_name__,
-        config_files=[CONFIG_PATH],
-        env_prefix=None,
-    )
+# Number of release groups whose canonical releases are resolved at once
+RELEASE_GROUP_BATCH_SIZE = 64
+# Number of artists synchronized concurrently
+ARTIST_SYNC_MAX_WORKERS = 4
+# Number of releases, and of recordings, synchronized concurrently
+SYNC_MAX_WORKERS = 4
 
+try:
     app = App(version=__version__)
 except Exception:
     logger.exception(f"Exception arose during the app setup")
@@ -93,25 +110,25 @@ def sync_databases(
     notion_api_key: Annotated[
         str | None,
         Parameter(["--notion", "-n"], env_var=EnvironmentVar.NOTION_API_KEY),
-    ] = loaded_settings.notion_api_key or None,
+    ] = None,
     artist_db_id: Annotated[
         str | None,
         Parameter(["--artist", "-a"], env_var=EnvironmentVar.ARTIST_DB_ID),
-    ] = loaded_settings.artist_db_id or None,
+    ] = None,
     release_db_id: Annotated[
         str | None,
         Parameter(["--release", "-r"], env_var=EnvironmentVar.RELEASE_DB_ID),
-    ] = loaded_settings.release_db_id or None,
+    ] = None,
     track_db_id: Annotated[
         str | None,
         Parameter(["--track", "--recording", "-t"], env_var=EnvironmentVar.TRACK_DB_ID),
-    ] = loaded_settings.track_db_id or None,
+    ] = None,
     fanart_api_key: Annotated[
         str | None,
         Parameter(["--fanart", "-f"], env_var=EnvironmentVar.FANART_API_KEY),
-    ] = loaded_settings.fanart_api_key,
+    ] = None,
     *,
-    loaded_settings: Annotated[Settings, Parameter(parse=False)] = loaded_settings,
+    loaded_settings: Annotated[Settings | None, Parameter(parse=False)] = None,
 ) -> None:
     """
     Synchronize Notion's Artist, Release, and Track databases with MusicBrainz data.
@@ -122,8 +139,18 @@ def sync_databases(
         release_db_id: Release database ID.
         track_db_id: Track database ID.
         fanart_api_key: Fanart API key.
-        loaded_settings: Settings loaded from the configuration file.
+        loaded_settings: Settings loaded from the configuration file. If None,
+            they are loaded when the command is run.
     """
+    # Options not given in the command line or environment fall back to the config file
+    if loaded_settings is None:
+        loaded_settings = load_settings()
+    notion_api_key = notion_api_key or loaded_settings.notion_api_key or None
+    artist_db_id = artist_db_id or loaded_settings.artist_db_id or None
+    release_db_id = release_db_id or loaded_settings.release_db_id or None
+    track_db_id = track_db_id or loaded_settings.track_db_id or None
+    fanart_api_key = fanart_api_key or loaded_settings.fanart_api_key
+
     # Get a valid notion API key
     # TODO: Make a separate functions for this in config module
     if notion_api_key is None:
@@ -143,7 +170,7 @@ def sync_databases(
             tomlkit.dump(full_settings, f)
 
     # Initialize the Notion client
-    notion_client = Client(auth=notion_api_key)
+    notion_client = RateLimitedClient(auth=notion_api_key)
 
     # Get valid database ids
     if None in {artist_db_id, release_db_id, track_db_id}:
@@ -199,21 +226,146 @@ def sync_databases(
         fanart_api_key=fanart_api_key,
     )
 
-    # Initialize the MusicBrainz client
-    initialize_musicbrainz_client(__app_name__, __version__, __author_email__)
+    # Initialize the MusicBrainz client and the cover URL cache
+    if settings.clear_cache:
+        clear_musicbrainz_cache()
+        clear_cover_url_cache()
+    initialize_musicbrainz_client(
+        __app_name__,
+        __version__,
+        __author_email__,
+        cache_expiration=(
+            timedelta(days=settings.mb_cache_expiration_days) if settings.use_cache else None
+        ),
+    )
+    initialize_cover_url_cache(COVER_URL_CACHE_EXPIRATION if settings.use_cache else None)
     logger.info("MusicBrainz client initialized.")
 
-    # TODO: Replace by a TypeDict
-    database_ids = {
-        EntityType.ARTIST: settings.artist_db_id,
-        EntityType.RELEASE: settings.release_db_id,
-        EntityType.RECORDING: settings.track_db_id,
-    }
+    # === Retrieve artists to update === #
+    marked_artist_mbid_to_page_id_map = fetch_artists_to_update(
+        notion_client, settings.artist_db_id
+    )
+    to_update_artist_mbids = [*marked_artist_mbid_to_page_id_map, *settings.artists_to_update]
+    if not to_update_artist_mbids:
+        logger.info("No artist to update.")
+        return
+    logger.info(f"Updating {len(to_update_artist_mbids)} artists.")
+
+    canonical_release_lookup = load_canonical_release_lookup(settings)
+
+    context = SyncContext(
+        notion_client=notion_client,
+        settings=settings,
+        database_ids={
+            EntityType.ARTIST: settings.artist_db_id,
+            EntityType.RELEASE: settings.release_db_id,
+            EntityType.RECORDING: settings.track_db_id,
+        },
+        mbid_to_page_id_map=compute_all_mbid_to_page_id_map(notion_client, settings),
+        # Content hashes of the pages at their last synchronization, to skip unchanged pages
+        content_hashes=load_sync_hashes(),
+    )
+
+    # === Fetch and update each artist, release and recording data === #
+    # The hashes and fallback canonical releases are saved even if the synchronization
+    # fails midway, so that the work already done isn't repeated on the next run
+    try:
+        sync_releases_and_recordings(
+            iter_artists_release_groups(to_update_artist_mbids, context),
+            canonical_release_lookup,
+            context,
+        )
+    finally:
+        save_sync_hashes(context.content_hashes)
+        save_fallback_canonical_releases(canonical_release_lookup, DATA_DIR)
+
+    del canonical_release_lookup
+
+    # === Check for old releases and recordings to delete === #
+    move_to_trash_outdated_pages(context)
+
+    # === Update "To update" property of artists === #
+    # Artists only listed in the settings are not marked in Notion
+    unmark_artists(notion_client, marked_artist_mbid_to_page_id_map.values())
+
+
+@attrs.define(kw_only=True)
+class SyncContext:
+    """
+    State shared by the synchronization stages of a run.
+
+    Attributes:
+        notion_client: Notion API client.
+        settings: Settings of the synchronization.
+        database_ids: Dictionary mapping entity types to their respective
+            Notion database IDs.
+        mbid_to_page_id_map: A mapping of MBIDs to page IDs in the Notion
+            databases, completed with the created pages.
+        content_hashes: Content hashes of the pages at their last
+            synchronization, updated with the synchronized pages.
+        updated_page_ids: Page IDs of the synchronized pages, and of the
+            existing pages that couldn't be synchronized, by entity type.
+    """
+
+    notion_client: RateLimitedClient
+    settings: Settings
+    database_ids: dict[EntityType, str]
+    mbid_to_page_id_map: dict[MBID, PageId]
+    content_hashes: SyncHashes
+    updated_page_ids: dict[EntityType, set[PageId]] = attrs.field(
+        factory=lambda: {
+            EntityType.ARTIST: set(),
+            EntityType.RELEASE: set(),
+            EntityType.RECORDING: set(),
+        }
+    )
+
+    def synchronize(self, entity: MusicBrainzEntity) -> None:
+        """
+        Synchronize the page of an entity and record its page ID as updated.
+
+        Args:
+            entity (MusicBrainzEntity): The entity to synchronize.
+        """
+        entity.synchronize_notion_page(
+            notion_api=self.notion_client,
+            database_ids=self.database_ids,
+            mbid_to_page_id_map=self.mbid_to_page_id_map,
+            min_nb_tags=self.settings.min_nb_tags,
+            fanart_api_key=self.settings.fanart_api_key,
+            content_hashes=self.content_hashes,
+        )
+        self.updated_page_ids[entity.entity_type].add(self.mbid_to_page_id_map[entity.mbid])
+
+    def keep_existing_page(self, entity_type: EntityType, mbid: MBID) -> None:
+        """
+        Record the page of an entity that couldn't be synchronized as updated, if it exists.
+
+        This prevents moving to trash a valid page because its data couldn't be
+        fetched during this run.
+
+        Args:
+            entity_type (EntityType): The type of the entity.
+            mbid (MBID): The MBID of the entity.
+        """
+        if (page_id := self.mbid_to_page_id_map.get(mbid)) is not None:
+            self.updated_page_ids[entity_type].add(page_id)
 
-    # Loading canonical data
+
+def load_canonical_release_lookup(settings: Settings) -> CanonicalReleaseLookup:
+    """
+    Load the canonical data, downloading it if needed, and return the canonical release lookup.
+
+    Args:
+        settings (Settings): Settings of the synchronization.
+
+    Returns:
+        CanonicalReleaseLookup: The canonical releases of the release groups.
+    """
     # Create data dir if it doesn't exist
     DATA_DIR.mkdir(exist_ok=True)
-    if settings.force_update_canonical_data or not DATA_DIR.iterdir():
+    is_updated = settings.force_update_canonical_data or not is_canonical_data_ready(DATA_DIR)
+    if is_updated:
         canonical_release_df = update_canonical_data(DATA_DIR)
     else:
         try:
@@ -221,149 +373,315 @@ def sync_databases(
         except MissingCanonicalDataError:
             logger.warning(f"Canonical data not found in {DATA_DIR}. Updating...")
             canonical_release_df = update_canonical_data(DATA_DIR)
+            is_updated = True
 
-    # === Retrieve artists to update and compute mbid to page id map === #
-    to_update_artist_mbids, artist_mbid_to_page_id_map = fetch_artists_to_update(
-        notion_client, settings.artist_db_id
+    # Only the release group -> canonical release lookup is needed from now on
+    return CanonicalReleaseLookup(
+        get_release_group_to_release_lookup(canonical_release_df), is_updated=is_updated
     )
-    to_update_artist_mbids += settings.artists_to_update
-    logger.info(f"Updating {len(to_update_artist_mbids)} artists.")
 
-    release_mbid_to_page_id_map = compute_mbid_to_page_id_map(notion_client, settings.release_db_id)
-    recording_mbid_to_page_id_map = compute_mbid_to_page_id_map(notion_client, settings.track_db_id)
 
-    mbid_to_page_id_map: dict[str, str] = dicttoolz.merge(
-        artist_mbid_to_page_id_map, release_mbid_to_page_id_map, recording_mbid_to_page_id_map
-    )
+def compute_all_mbid_to_page_id_map(
+    notion_client: RateLimitedClient, settings: Settings
+) -> dict[MBID, PageId]:
+    """
+    Return the mapping of MBIDs to page IDs of the artist, release and track databases.
+
+    Args:
+        notion_client (RateLimitedClient): Notion API client.
+        settings (Settings): Settings of the synchronization.
+
+    Returns:
+        dict[MBID, PageId]: A mapping of the MBIDs to the page IDs of the
+            pages of the three databases.
+    """
     # TODO: Don't fetch all mbids because it doesn't scale well for large databases
+    # The databases are independent so they are scanned concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        map_futures = [
+            executor.submit(compute_mbid_to_page_id_map, notion_client, database_id)
+            for database_id in (settings.artist_db_id, settings.release_db_id, settings.track_db_id)
+        ]
 
-    # === Fetch and update each artists data and retrieve their release groups === #
-    all_release_groups_data: list[MBDataDict] = []
-    for artist_mbid in to_update_artist_mbids:
-        artist_data = fetch_artist_data(artist_mbid)
-        if artist_data is None:
-            continue
-
-        artist = Artist.from_musicbrainz_data(
-            artist_data=artist_data,
-            auto_added=False,
-            min_nb_tags=settings.min_nb_tags,
-            fanart_api_key=fanart_api_key,
-        )
-        artist.synchronize_notion_page(
-            notion_api=notion_client,
-            database_ids=database_ids,
-            mbid_to_page_id_map=mbid_to_page_id_map,
-            min_nb_tags=settings.min_nb_tags,
-            fanart_api_key=fanart_api_key,
-        )
+    artist_map, release_map, recording_map = (future.result() for future in map_futures)
+
+    return {**artist_map, **release_map, **recording_map}
+
+
+def sync_artist(artist_mbid: MBID, context: SyncContext) -> list[MBDataDict]:
+    """
+    Synchronize an artist to update and return their release groups.
+
+    Args:
+        artist_mbid (MBID): The MBID of the artist.
+        context (SyncContext): State of the synchronization.
+
+    Returns:
+        list[MBDataDict]: The release groups of the artist, empty if the
+            artist data couldn't be fetched.
+    """
+    artist_data = fetch_artist_data(artist_mbid)
+    if artist_data is None:
+        return []
+
+    artist = Artist.from_musicbrainz_data(
+        artist_data=artist_data,
+        auto_added=False,
+        min_nb_tags=context.settings.min_nb_tags,
+        fanart_api_key=context.settings.fanart_api_key,
+    )
+    context.synchronize(artist)
 
-        release_groups_data = browse_release_groups_by_artist(
+    return list(
+        browse_release_groups_by_artist(
             artist_mbid=artist_mbid,
-            release_type=settings.release_type_filter,
-            secondary_type_exclude=settings.release_secondary_type_exclude,
+            release_type=context.settings.release_type_filter,
+            secondary_type_exclude=context.settings.release_secondary_type_exclude,
         )
-        release_groups_data = release_groups_data or []
+    )
+
+
+def iter_artists_release_groups(
+    artist_mbids: Iterable[MBID], context: SyncContext
+) -> Iterator[MBDataDict]:
+    """
+    Synchronize the artists concurrently and yield their release groups, without duplicates.
 
-        all_release_groups_data += release_groups_data
+    Args:
+        artist_mbids (Iterable[MBID]): The MBIDs of the artists to update.
+        context (SyncContext): State of the synchronization.
 
-    # === Fetch and update each canonical release data === #
-    release_group_mbids = [release_group["id"] for release_group in all_release_groups_data]
+    Yields:
+        MBDataDict: The release groups of the artists.
+    """
+    seen_release_group_mbids: set[MBID] = set()
+    with ThreadPoolExecutor(max_workers=ARTIST_SYNC_MAX_WORKERS) as executor:
+        for release_groups_data in executor.map(
+            partial(sync_artist, context=context), dict.fromkeys(artist_mbids)
+        ):
+            # Release groups shared by several artists are only yielded once
+            for release_group_data in release_groups_data:
+                if release_group_data["id"] not in seen_release_group_mbids:
+                    seen_release_group_mbids.add(release_group_data["id"])
+                    yield release_group_data
+
+
+def sync_recording(
+    recording_mbid: MBID, track_number: str, release: Release, context: SyncContext
+) -> None:
+    """
+    Synchronize a recording of a canonical release.
 
-    release_group_to_release_map = get_release_map_with_auto_update(
-        release_group_mbids=release_group_mbids,
-        data_dir=DATA_DIR,
-        canonical_release_df=canonical_release_df,
+    Args:
+        recording_mbid (MBID): The MBID of the recording.
+        track_number (str): The formatted track number of the recording in
+            the release.
+        release (Release): The release of the recording.
+        context (SyncContext): State of the synchronization.
+    """
+    recording_data = fetch_recording_data(recording_mbid)
+    if recording_data is None:
+        context.keep_existing_page(EntityType.RECORDING, recording_mbid)
+        return
+
+    recording = Recording.from_musicbrainz_data(
+        recording_data=recording_data,
+        formatted_track_number=track_number,
+        release=release,
+        min_nb_tags=context.settings.min_nb_tags,
+        add_thumbnail=context.settings.add_track_thumbnail,
     )
-    del canonical_release_df
-
-    updated_recording_page_ids = set()
-    for release_group_data in all_release_groups_data:
-        release_group_mbid = release_group_data["id"]
-        release_mbid = release_group_to_release_map[release_group_mbid]
-
-        release_data = fetch_release_data(release_mbid)
-        if release_data is None:
-            continue
-
-        release = Release.from_musicbrainz_data(
-            release_data=release_data,
-            release_group_data=release_group_data,
-            min_nb_tags=settings.min_nb_tags,
-            cover_size=settings.cover_size,
-        )
-        release.synchronize_notion_page(
-            notion_api=notion_client,
-            database_ids=database_ids,
-            mbid_to_page_id_map=mbid_to_page_id_map,
-            min_nb_tags=settings.min_nb_tags,
-            fanart_api_key=fanart_api_key,
-        )
+    context.synchronize(recording)
+
+
+def sync_release(
+    release_group_data: MBDataDict, release_mbid: MBID, context: SyncContext
+) -> tuple[Release, list[tuple[MBID, str]]] | None:
+    """
+    Synchronize a canonical release.
 
-        # === Fetch and update each recording data === #
-        for recording_mbid, track_number in extract_recording_mbids_and_track_number(release_data):
-            recording_data = fetch_recording_data(recording_mbid)
-            if recording_data is None:
+    Args:
+        release_group_data (MBDataDict): The release group of the release.
+        release_mbid (MBID): The MBID of the canonical release.
+        context (SyncContext): State of the synchronization.
+
+    Returns:
+        tuple[Release, list[tuple[MBID, str]]] | None: The release and the
+            MBIDs and track numbers of its recordings, or None if the release
+            data couldn't be fetched.
+    """
+    release_data = fetch_release_data(release_mbid)
+    if release_data is None:
+        context.keep_existing_page(EntityType.RELEASE, release_mbid)
+        return None
+
+    release = Release.from_musicbrainz_data(
+        release_data=release_data,
+        release_group_data=release_group_data,
+        min_nb_tags=context.settings.min_nb_tags,
+        cover_size=context.settings.cover_size,
+    )
+    context.synchronize(release)
+
+    return release, list(extract_recording_mbids_and_track_number(release_data))
+
+
+def sync_releases_and_recordings(
+    release_groups: Iterable[MBDataDict],
+    canonical_release_lookup: CanonicalReleaseLookup,
+    context: SyncContext,
+) -> None:
+    """
+    Synchronize the canonical releases of the release groups and their recordings.
+
+    The release groups are resolved to canonical releases by batch in this
+    thread while the releases are synchronized by the workers. The recordings
+    are then synchronized once all the releases have their page, so that
+    their release relation doesn't depend on the order of completion of the
+    releases. A recording appearing on several releases is synchronized once,
+    with the track number and thumbnail of the first of these releases in the
+    order of the release groups.
+
+    Args:
+        release_groups (Iterable[MBDataDict]): The release groups to
+            synchronize.
+        canonical_release_lookup (CanonicalReleaseLookup): The canonical
+            releases of the release groups.
+        context (SyncContext): State of the synchronization.
+    """
+    release_futures: list[Future[tuple[Release, list[tuple[MBID, str]]] | None]] = []
+    submitted_release_mbids: set[MBID] = set()
+    with ThreadPoolExecutor(max_workers=SYNC_MAX_WORKERS) as release_executor:
+        for release_groups_batch in batched(release_groups, RELEASE_GROUP_BATCH_SIZE):  # noqa: B911
+            release_group_to_release_map = get_release_map_with_auto_update(
+                release_group_mbids=[release_group["id"] for release_group in release_groups_batch],
+                data_dir=DATA_DIR,
+                canonical_release_lookup=canonical_release_lookup,
+            )
+            for release_group_data in release_groups_batch:
+                release_mbid = release_group_to_release_map[release_group_data["id"]]
+                if release_mbid in submitted_release_mbids:
+                    continue
+                submitted_release_mbids.add(release_mbid)
+                release_futures.append(
+                    release_executor.submit(sync_release, release_group_data, release_mbid, context)
+                )
+
+        # The futures are read in submission order for the first release of each recording
+        recording_releases: dict[MBID, tuple[str, Release]] = {}
+        for release_future in release_futures:
+            if (synced_release := release_future.result()) is None:
                 continue
-            recording = Recording.from_musicbrainz_data(
-                recording_data=recording_data,
-                formatted_track_number=track_number,
-                release=release,
-                min_nb_tags=settings.min_nb_tags,
-                add_thumbnail=settings.add_track_thumbnail,
+            release, recordings = synced_release
+            for recording_mbid, track_number in recordings:
+                recording_releases.setdefault(recording_mbid, (track_number, release))
+
+    with ThreadPoolExecutor(max_workers=SYNC_MAX_WORKERS) as recording_executor:
+        recording_futures = [
+            recording_executor.submit(
+                sync_recording, recording_mbid, track_number, release, context
+            )
+            for recording_mbid, (track_number, release) in recording_releases.items()
+        ]
+        for recording_future in recording_futures:
+            recording_future.result()
+
+
+def move_to_trash_outdated_pages(context: SyncContext) -> None:
+    """
+    Move to trash the releases and recordings of the updated artists that weren't synchronized.
+
+    Args:
+        context (SyncContext): State of the synchronization.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        trash_futures = [
+            executor.submit(
+                move_to_trash_outdated_entity_pages,
+                notion_api=context.notion_client,
+                database_id=context.database_ids[entity_type],
+                entity_type=entity_type,
+                updated_entity_page_ids=context.updated_page_ids[entity_type],
+                artist_page_ids=context.updated_page_ids[EntityType.ARTIST],
+                artist_property=artist_property,
             )
-            recording.synchronize_notion_page(
-                notion_api=notion_client,
-                database_ids=database_ids,
-                mbid_to_page_id_map=mbid_to_page_id_map,
-                min_nb_tags=settings.min_nb_tags,
-                fanart_api_key=fanart_api_key,
+            for entity_type, artist_property in (
+                (EntityType.RELEASE, ReleaseDBProperty.ARTIST),
+                (EntityType.RECORDING, TrackDBProperty.TRACK_ARTIST),
             )
+        ]
+        for future in trash_futures:
+            future.result()
 
-            updated_recording_page_ids.add(mbid_to_page_id_map[recording_mbid])
 
-    # === Check for old releases and recordings to delete === #
-    updated_artist_page_ids = {
-        artist_mbid_to_page_id_map[artist_mbid] for artist_mbid in to_update_artist_mbids
-    }
-    updated_release_page_ids = {
-        mbid_to_page_id_map[release_mbid] for release_mbid in release_group_to_release_map.values()
-    }
-
-    move_to_trash_outdated_entity_pages(
-        notion_api=notion_client,
-        database_id=database_ids[EntityType.RELEASE],
-        entity_type=EntityType.RELEASE,
-        updated_entity_page_ids=updated_release_page_ids,
-        artist_page_ids=updated_artist_page_ids,
-        artist_property=ReleaseDBProperty.ARTIST,
-    )
+def unmark_artists(notion_client: RateLimitedClient, artist_page_ids: Iterable[PageId]) -> None:
+    """
+    Uncheck the "To update" property of the synchronized artists.
+
+    Args:
+        notion_client (RateLimitedClient): Notion API client.
+        artist_page_ids (Iterable[PageId]): The page IDs of the artists.
+    """
+    updated_properties = {ArtistDBProperty.TO_UPDATE: format_checkbox(False)}
+
+    def unmark_artist(page_id: PageId) -> None:
+        notion_client.pages.update(page_id=page_id, properties=updated_properties)
+
+    with ThreadPoolExecutor(max_workers=NOTION_MAX_WORKERS) as executor:
+        _ = list(executor.map(unmark_artist, artist_page_ids))
+
 
-    move_to_trash_outdated_entity_pages(
-        notion_api=notion_client,
-        database_id=database_ids[EntityType.RECORDING],
-        entity_type=EntityType.RECORDING,
-        updated_entity_page_ids=updated_recording_page_ids,
-        artist_page_ids=updated_artist_page_ids,
-        artist_property=TrackDBProperty.TRACK_ARTIST,
+@app.meta.default
+def launch(
+    *tokens: Annotated[str, Parameter(show=False, allow_leading_hyphen=True)],
+    use_cache: Annotated[bool | None, Parameter(["--cache"], negative=["--no-cache"])] = None,
+    clear_cache: Annotated[bool, Parameter(["--clear-cache"], negative=[])] = False,
+) -> None:
+    """
+    Run the command with the settings of the configuration file.
+
+    The cache options given in the command line override the ones of the
+    configuration file.
+
+    Args:
+        tokens: Arguments of the command.
+        use_cache: Whether to cache MusicBrainz responses and cover URLs on
+            disk between runs.
+        clear_cache: Whether to clear the caches before synchronizing, to
+            fetch up to date data.
+    """
+    loaded_settings = load_settings()
+    loaded_settings = attrs.evolve(
+        loaded_settings,
+        use_cache=loaded_settings.use_cache if use_cache is None else use_cache,
+        clear_cache=loaded_settings.clear_cache or clear_cache,
     )
 
-    # === Update "To update" property of artists === #
-    for artist_mbid in to_update_artist_mbids:
-        page_id = artist_mbid_to_page_id_map[artist_mbid]
-        notion_client.pages.update(
-            page_id=page_id,
-            properties={ArtistDBProperty.TO_UPDATE: format_checkbox(False)},
-        )
+    command, bound, ignored = app.parse_args(tokens)
+    # Only the synchronization command takes the settings
+    settings_kwargs = {"loaded_settings": loaded_settings} if "loaded_settings" in ignored else {}
+    command(*bound.args, **bound.kwargs, **settings_kwargs)
 
 
 def main() -> None:
     """Initialize and launch the app."""
+    if os.getenv(EnvironmentVar.DEBUG):
+        # Imported here since frosch is heavy and only needed for debugging
+        import frosch  # noqa: PLC0415  # pyright: ignore[reportMissingTypeStubs]
+
+        frosch.hook()  # enable frosch for easier debugging
+
+    log_dir = PROJECT_ROOT / "logs"
+    setup_logging(log_dir=log_dir)
+
     logger.info(f"🎉 Starting database synchronization! 🎉")
     logger.info(f"Application root directory set to {PROJECT_ROOT}")
     load_dotenv(PROJECT_ROOT / ".env")
 
-    app()
+    try:
+        app.meta()
+    finally:
+        close_musicbrainz_client()
 
 
 if __name__ == "__main__":
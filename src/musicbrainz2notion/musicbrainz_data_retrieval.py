@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
-from functools import partial
-from typing import TYPE_CHECKING
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import partial, update_wrapper
+from threading import Lock
+from typing import TYPE_CHECKING, Any
 
 import dateutil.parser
+import httpx
 import musicbrainzngs  # pyright: ignore[reportMissingTypeStubs]
+import musicbrainzngs.musicbrainz  # pyright: ignore[reportMissingTypeStubs]
 from loguru import logger
 
+from musicbrainz2notion.__about__ import PROJECT_ROOT
+from musicbrainz2notion.config import global_settings
+from musicbrainz2notion.keyed_lock import KeyedLock
 from musicbrainz2notion.musicbrainz_utils import (
     MBID,
     EntityType,
@@ -16,9 +26,12 @@ from musicbrainz2notion.musicbrainz_utils import (
     MBDataDict,
     MBDataField,
 )
+from musicbrainz2notion.rate_limiter import SlidingWindowRateLimiter
+from musicbrainz2notion.response_cache import ResponseCache
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Sequence
+    from collections.abc import Callable, Iterator, Sequence
+    from pathlib import Path
 
 logger = logger.opt(colors=True)
 logger.opt = partial(logger.opt, colors=True)
@@ -27,6 +40,197 @@ logger.opt = partial(logger.opt, colors=True)
 MB_API_RATE_LIMIT_INTERVAL = 1  # Seconds
 MB_API_REQUEST_PER_INTERVAL = 10
 
+MB_CACHE_PATH = PROJECT_ROOT / "cache" / "musicbrainz.sqlite"
+MB_CACHE_EXPIRATION = timedelta(days=7)
+# Number of entities kept in memory by each fetch function, the returned data is
+# shared between calls and must not be modified
+MB_DATA_CACHE_SIZE = 4096
+
+# Number of kept-alive connections to the MusicBrainz API, shared by all the threads
+MB_HTTP_MAX_CONNECTIONS = 4
+MB_MAX_RETRIES = 8
+MB_RETRY_DELAY = 2  # Seconds, multiplied by the retry number
+
+# Only the sub-resources used to build the Notion pages are requested, since
+# each include makes the responses bigger and slower to compute
+ARTIST_INCLUDES = [
+    IncludeOption.ALIASES,  # Alias property
+    IncludeOption.TAGS,  # Tags property
+    IncludeOption.RATINGS,  # Rating property
+    IncludeOption.URL_RELS,  # Wikidata thumbnail
+]
+RELEASE_INCLUDES = [
+    IncludeOption.TAGS,  # Tags property
+    IncludeOption.RECORDINGS,  # Tracklist
+    IncludeOption.ARTIST_CREDITS,  # Artist relation
+]
+RECORDING_INCLUDES = [
+    IncludeOption.ARTIST_CREDITS,  # Artist relation
+    IncludeOption.TAGS,  # Tags property
+    IncludeOption.RATINGS,  # Rating property
+    IncludeOption.RELEASES,  # Release relation, with the other releases in the database
+]
+RELEASE_GROUP_INCLUDES = [IncludeOption.RELEASES]  # Fallback canonical release
+BROWSE_RELEASE_GROUP_INCLUDES = [IncludeOption.RATINGS]  # Rating property of the releases
+
+# Lookup functions of musicbrainzngs for each entity type
+_MB_GET_FUNCS: dict[EntityType, Callable[..., Any]] = {
+    EntityType.ARTIST: musicbrainzngs.get_artist_by_id,
+    EntityType.RELEASE: musicbrainzngs.get_release_by_id,
+    EntityType.RECORDING: musicbrainzngs.get_recording_by_id,
+    EntityType.RELEASE_GROUP: musicbrainzngs.get_release_group_by_id,
+}
+
+# Pooled client sending the MusicBrainz GET requests, shared by all the threads
+_mb_http_client = httpx.Client(
+    timeout=global_settings.REQUEST_TIMEOUT,
+    limits=httpx.Limits(
+        max_connections=MB_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=MB_HTTP_MAX_CONNECTIONS,
+    ),
+)
+
+# Request function of musicbrainzngs, without its rate limiting wrapper
+_unlimited_mb_request: Callable[..., Any] = musicbrainzngs.musicbrainz._mb_request.fun  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+
+def _get_retry_delay(response: httpx.Response, retry_num: int) -> float:
+    """
+    Return the delay before retrying a request rejected by the MusicBrainz API.
+
+    Args:
+        response (httpx.Response): The response rejecting the request.
+        retry_num (int): The number of the next retry, starting at 1.
+
+    Returns:
+        float: The delay in seconds given by the `Retry-After` header of the
+            response, or an increasing delay if it is missing or not a number
+            of seconds.
+    """
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return retry_num * MB_RETRY_DELAY
+
+
+def _get_mb_response(
+    http_client: httpx.Client,
+    rate_limiter: SlidingWindowRateLimiter,
+    path: str,
+    args: dict[str, Any] | None,
+) -> Any:
+    """
+    Send a GET request to the MusicBrainz API and parse the response like musicbrainzngs.
+
+    Contrary to musicbrainzngs, which opens a new connection for each request,
+    the connections of the client are kept alive and reused between requests.
+    Transient errors lead to retries, and errors are translated into the
+    exceptions of musicbrainzngs. Each try counts in the rate limit, so that
+    the retries of concurrent requests don't exceed it.
+
+    Args:
+        http_client (httpx.Client): The HTTP client used to send the request.
+        rate_limiter (SlidingWindowRateLimiter): The rate limiter of the
+            MusicBrainz API requests.
+        path (str): The path of the request endpoint.
+        args (dict[str, Any] | None): The arguments of the request.
+
+    Returns:
+        Any: The response parsed by the parser of musicbrainzngs.
+    """
+    mb_module = musicbrainzngs.musicbrainz
+    params = dict(args or {})
+    if mb_module.ws_format != "xml":
+        params["fmt"] = mb_module.ws_format
+    scheme = "https" if mb_module.https else "http"
+    url = f"{scheme}://{mb_module.hostname}/ws/2/{path}"
+    headers = {"User-Agent": mb_module._useragent}  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+    last_exc: Exception | None = None
+    retry_delay = 0.0
+    for retry_num in range(MB_MAX_RETRIES):
+        if retry_num:  # Not the first try: delay as asked by the API or an increasing amount
+            logger.debug(f"Retrying MusicBrainz request after {retry_delay}s delay (#{retry_num})")
+            time.sleep(retry_delay)
+
+        rate_limiter.acquire()
+        try:
+            response = http_client.get(url, params=sorted(params.items()), headers=headers)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            match exc.response.status_code:
+                case 400 | 404 | 411:
+                    raise musicbrainzngs.ResponseError(cause=exc) from exc
+                case 401:
+                    raise musicbrainzngs.AuthenticationError(cause=exc) from exc
+                case _:
+                    # Rate limiting, internal overloading...
+                    last_exc = exc
+                    retry_delay = _get_retry_delay(exc.response, retry_num + 1)
+        except httpx.ConnectError as exc:
+            raise musicbrainzngs.NetworkError(cause=exc) from exc
+        except httpx.TransportError as exc:
+            last_exc = exc
+            retry_delay = (retry_num + 1) * MB_RETRY_DELAY
+        else:
+            return mb_module.parser_fun(response.content)
+
+    raise musicbrainzngs.NetworkError(cause=last_exc)
+
+
+def _set_mb_request_wrapper(
+    rate_limiter: SlidingWindowRateLimiter,
+    cache: ResponseCache | None,
+    http_client: httpx.Client | None = None,
+) -> None:
+    """
+    Replace the rate limiting of the requests sent by musicbrainzngs and cache their responses.
+
+    Cached responses don't count in the rate limit.
+
+    Args:
+        rate_limiter (SlidingWindowRateLimiter): The rate limiter to use for
+            the MusicBrainz API requests.
+        cache (ResponseCache | None): The cache of the responses of
+            GET requests. If None, responses are not cached.
+        http_client (httpx.Client | None): The HTTP client used to send the
+            unauthenticated GET requests. If None, all requests are sent by
+            musicbrainzngs.
+    """
+    mb_module = musicbrainzngs.musicbrainz
+
+    def send_mb_request(
+        path: str,
+        method: str = "GET",
+        auth_required: Any = mb_module.AUTH_NO,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        if (
+            http_client is None
+            or method != "GET"
+            or auth_required is mb_module.AUTH_YES
+            or mb_module.user
+        ):
+            rate_limiter.acquire()
+            return _unlimited_mb_request(path, method, auth_required, *args, **kwargs)
+
+        return _get_mb_response(http_client, rate_limiter, path, kwargs.get("args"))
+
+    def wrapped_mb_request(path: str, method: str = "GET", *args: Any, **kwargs: Any) -> Any:
+        if cache is None or method != "GET":
+            return send_mb_request(path, method, *args, **kwargs)
+
+        key = cache.make_key(path, kwargs.get("args"))
+        response = cache.get(key)
+        if response is None:
+            response = send_mb_request(path, method, *args, **kwargs)
+            cache.set(key, response)
+
+        return response
+
+    musicbrainzngs.musicbrainz._mb_request = wrapped_mb_request  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
 
 def initialize_musicbrainz_client(
     app_name: str,
@@ -34,6 +238,7 @@ def initialize_musicbrainz_client(
     app_contact: str,
     rate_limit_interval: int = MB_API_RATE_LIMIT_INTERVAL,
     request_per_interval: int = MB_API_REQUEST_PER_INTERVAL,
+    cache_expiration: timedelta | None = MB_CACHE_EXPIRATION,
 ) -> None:
     """
     Initialize the MusicBrainz API.
@@ -46,17 +251,52 @@ def initialize_musicbrainz_client(
             to MB_API_RATE_LIMIT_INTERVAL.
         request_per_interval (int): The number of requests per interval. Defaults to
             MB_API_REQUEST_PER_INTERVAL.
+        cache_expiration (timedelta | None): Time after which the responses
+            cached on disk are fetched again. If None, responses are not
+            cached. Defaults to MB_CACHE_EXPIRATION.
     """
     musicbrainzngs.set_useragent(app_name, app_version, app_contact)
-    musicbrainzngs.set_rate_limit(rate_limit_interval, request_per_interval)
+
+    cache = None
+    if cache_expiration is not None:
+        cache = ResponseCache(MB_CACHE_PATH, expire_after=cache_expiration)
+        cache.prune_expired()
+
+    _set_mb_request_wrapper(
+        rate_limiter=SlidingWindowRateLimiter(
+            interval=rate_limit_interval, max_calls=request_per_interval
+        ),
+        cache=cache,
+        http_client=_mb_http_client,
+    )
+
+
+def close_musicbrainz_client() -> None:
+    """Close the connections kept alive to the MusicBrainz API."""
+    _mb_http_client.close()
+
+
+def clear_musicbrainz_cache(path: Path = MB_CACHE_PATH) -> None:
+    """
+    Remove all the cached MusicBrainz responses, to fetch up to date data.
+
+    The entities data kept in memory by the fetch functions are dropped too.
+
+    Args:
+        path (Path): Path to the SQLite database of the cache.
+    """
+    ResponseCache(path, expire_after=MB_CACHE_EXPIRATION).clear()
+    for fetch_func in (fetch_artist_data, fetch_release_data, fetch_recording_data):
+        fetch_func.cache_clear()
+    logger.info(f"MusicBrainz response cache cleared.")
 
 
 def fetch_MB_entity_data(
     entity_type: EntityType,
     mbid: MBID,
     includes: list[IncludeOption],
-    release_type: Sequence[str] | None = None,
-    release_status: Sequence[str] | None = None,
+    release_type: Sequence[str] = (),
+    release_status: Sequence[str] = (),
 ) -> MBDataDict | None:
     """
     Fetch entity data from MusicBrainz for a given entity MBID.
@@ -65,34 +305,22 @@ def fetch_MB_entity_data(
         entity_type (EntityType): The type of entity (artist, release, recording).
         mbid (str): The MusicBrainz ID (mbid) of the entity.
         includes (list[IncludeOption]): List of includes to fetch specific details.
-        release_type (list[str] | None): List of release types to include in the
-            response. Defaults to None (no filtering).
-        release_status (list[str] | None): List of release statuses to include i
-            n the response. Defaults to None (no filtering).
+        release_type (Sequence[str]): Release types to include in the
+            response. Defaults to no filtering.
+        release_status (Sequence[str]): Release statuses to include in the
+            response. Defaults to no filtering.
 
     Returns:
         MBDataDict | None: The dictionary of entity data from MusicBrainz. None if there was an error.
     """
-    logger.debug(f"Fetching {entity_type} data for mbid {mbid}")
-
-    if release_type is None:
-        release_type = []
-    if release_status is None:
-        release_status = []
+    # Arguments are only formatted if the message is logged
+    logger.debug("Fetching {entity_type} data for mbid {mbid}", entity_type=entity_type, mbid=mbid)
 
     # Determine the correct API call based on the entity type
-    match entity_type:
-        case EntityType.ARTIST:
-            get_func = musicbrainzngs.get_artist_by_id
-        case EntityType.RELEASE:
-            get_func = musicbrainzngs.get_release_by_id
-        case EntityType.RECORDING:
-            get_func = musicbrainzngs.get_recording_by_id
-        case EntityType.RELEASE_GROUP:
-            get_func = musicbrainzngs.get_release_group_by_id
-        case _:
-            logger.error(f"Unsupported entity type for fetching MusicBrainz data: {entity_type}")
-            return None
+    get_func = _MB_GET_FUNCS.get(entity_type)
+    if get_func is None:
+        logger.error(f"Unsupported entity type for fetching MusicBrainz data: {entity_type}")
+        return None
 
     try:
         result = get_func(
@@ -112,26 +340,91 @@ def fetch_MB_entity_data(
         )
 
         logger.debug(
-            f"Fetched {entity_type} data for <green>{entity_name}</> <dim>(mbid {mbid})</>"
+            "Fetched {entity_type} data for <green>{name}</> <dim>(mbid {mbid})</>",
+            entity_type=entity_type,
+            name=entity_name,
+            mbid=mbid,
         )
 
         return entity_data
 
 
+class _SingleFlightCache:
+    """
+    Memoized fetch function of MusicBrainz entities, shared by all the threads.
+
+    Concurrent calls for the same MBID send only one request: the first call
+    fetches the data while the others wait for it and then get the memoized
+    data. Failed fetches are not memoized so that the next calls retry them.
+    The least recently used entities are dropped once the maximum size is
+    reached.
+    """
+
+    def __init__(
+        self, fetch_func: Callable[[MBID], MBDataDict | None], maxsize: int = MB_DATA_CACHE_SIZE
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            fetch_func (Callable[[MBID], MBDataDict | None]): The fetch
+                function, taking the MBID of the entity and returning None on
+                failure.
+            maxsize (int): Maximum number of memoized entities. Defaults to
+                MB_DATA_CACHE_SIZE.
+        """
+        self._fetch_func = fetch_func
+        self._maxsize = maxsize
+        self._cache: OrderedDict[MBID, MBDataDict] = OrderedDict()
+        self._cache_lock = Lock()
+        self._mbid_locks: KeyedLock[MBID] = KeyedLock()
+        update_wrapper(self, fetch_func)
+
+    def __call__(self, mbid: MBID) -> MBDataDict | None:
+        """
+        Return the data of an entity, fetching it if it isn't memoized.
+
+        Args:
+            mbid (MBID): The MBID of the entity.
+
+        Returns:
+            MBDataDict | None: The data of the entity, None if it couldn't be
+                fetched. The data is shared between calls and must not be
+                modified.
+        """
+        with self._mbid_locks.hold(mbid):
+            with self._cache_lock:
+                entity_data = self._cache.get(mbid)
+                if entity_data is not None:
+                    self._cache.move_to_end(mbid)
+                    return entity_data
+
+            entity_data = self._fetch_func(mbid)
+            if entity_data is not None:
+                with self._cache_lock:
+                    self._cache[mbid] = entity_data
+                    if len(self._cache) > self._maxsize:
+                        self._cache.popitem(last=False)
+
+            return entity_data
+
+    def cache_clear(self) -> None:
+        """Drop all the memoized entities."""
+        with self._cache_lock:
+            self._cache.clear()
+
+
+@_SingleFlightCache
 def fetch_artist_data(mbid: MBID) -> MBDataDict | None:
     """Fetch artist data from MusicBrainz for the given artist mbid."""
     return fetch_MB_entity_data(
         entity_type=EntityType.ARTIST,
         mbid=mbid,
-        includes=[
-            IncludeOption.ALIASES,
-            IncludeOption.TAGS,
-            IncludeOption.RATINGS,
-            IncludeOption.URL_RELS,
-        ],
+        includes=ARTIST_INCLUDES,
     )
 
 
+@_SingleFlightCache
 def fetch_release_data(
     mbid: MBID,
 ) -> MBDataDict | None:
@@ -139,108 +432,149 @@ def fetch_release_data(
     return fetch_MB_entity_data(
         entity_type=EntityType.RELEASE,
         mbid=mbid,
-        includes=[
-            IncludeOption.TAGS,
-            IncludeOption.RECORDINGS,
-            IncludeOption.ARTIST_CREDITS,
-        ],
+        includes=RELEASE_INCLUDES,
     )
 
 
+@_SingleFlightCache
 def fetch_recording_data(mbid: MBID) -> MBDataDict | None:
     """Fetch recording data from MusicBrainz for a given recording MBID."""
     return fetch_MB_entity_data(
         entity_type=EntityType.RECORDING,
         mbid=mbid,
-        includes=[
-            IncludeOption.ARTIST_CREDITS,
-            IncludeOption.TAGS,
-            IncludeOption.RATINGS,
-            IncludeOption.RELEASES,
-        ],
+        includes=RECORDING_INCLUDES,
     )
 
 
 def fetch_release_group_data(mbid: MBID) -> MBDataDict | None:
-    """Fetch recording data from MusicBrainz for a given recording MBID."""
+    """Fetch release group data from MusicBrainz for a given release group MBID."""
     return fetch_MB_entity_data(
         entity_type=EntityType.RELEASE_GROUP,
         mbid=mbid,
-        includes=[IncludeOption.RELEASES],
+        includes=RELEASE_GROUP_INCLUDES,
     )
 
 
+def _browse_release_group_pages(
+    browse_page: Callable[..., Any], browse_limit: int
+) -> Iterator[MBDataDict]:
+    """
+    Fetch and yield the results of all the pages of a release group browse request, in order.
+
+    The first page gives the total count of release groups, then the other
+    pages are fetched concurrently and yielded as soon as they and the
+    previous ones are fetched. The iteration stops at the first empty page,
+    in case the count is wrong.
+
+    Args:
+        browse_page (Callable[..., Any]): Function sending the browse request
+            for a given offset.
+        browse_limit (int): Number of release groups per page.
+
+    Yields:
+        MBDataDict: The result of each page.
+    """
+
+    def browse_page_at(offset: int) -> MBDataDict:
+        return browse_page(offset=offset)
+
+    first_result = browse_page_at(0)
+    if not first_result.get("release-group-list"):
+        return
+    yield first_result
+
+    nb_release_groups = int(first_result.get("release-group-count", 0))
+    with ThreadPoolExecutor(max_workers=MB_HTTP_MAX_CONNECTIONS) as executor:
+        for result in executor.map(
+            browse_page_at, range(browse_limit, nb_release_groups, browse_limit)
+        ):
+            if not result.get("release-group-list"):
+                return
+            yield result
+
+
+def _exclude_secondary_types(
+    release_groups: list[MBDataDict], excluded_secondary_types: frozenset[str]
+) -> list[MBDataDict]:
+    """
+    Return the release groups that have none of the excluded secondary types.
+
+    Args:
+        release_groups (list[MBDataDict]): The release groups to filter.
+        excluded_secondary_types (frozenset[str]): Lowercase secondary types
+            to exclude.
+
+    Returns:
+        list[MBDataDict]: The release groups that are not excluded.
+    """
+    if not excluded_secondary_types:
+        return release_groups
+
+    # Most release groups have no secondary type and are kept without building a check
+    return [
+        release_group
+        for release_group in release_groups
+        if not (secondary_types := release_group.get(MBDataField.SECONDARY_TYPES))
+        or excluded_secondary_types.isdisjoint(map(str.lower, secondary_types))
+    ]
+
+
 # TODO: Add artist name for better logging?
 def browse_release_groups_by_artist(
     artist_mbid: str,
-    release_type: Sequence[str] | None = None,
-    secondary_type_exclude: Sequence[str] | None = None,
+    release_type: Sequence[str] = (),
+    secondary_type_exclude: Sequence[str] = (),
     browse_limit: int = 100,
-) -> list[MBDataDict] | None:
+) -> Iterator[MBDataDict]:
     """
-    Browse and return a list of all release groups by an artist from MusicBrainz.
+    Browse and yield all release groups by an artist from MusicBrainz.
+
+    The pages after the first one are fetched concurrently, and the release
+    groups are yielded page by page in order, so they can be processed without
+    waiting for all the pages.
 
     Args:
         artist_mbid (str): The MusicBrainz ID (mbid) of the artist.
-        release_type (list[str] | None): List of release types to filter.
-            Defaults to None (no filtering).
-        secondary_type_exclude (list[str] | None): List of secondary types to
-            exclude.
+        release_type (Sequence[str]): Release types to filter. Defaults to no
+            filtering.
+        secondary_type_exclude (Sequence[str]): Secondary types to exclude.
+            Defaults to no exclusion.
         browse_limit (int): Maximum number of release groups to retrieve per
             request (max is 100).
 
-    Returns:
-        list[MBDataDict] | None: A list of release groups from MusicBrainz. None
-            if there was an error while fetching the data.
+    Yields:
+        MBDataDict: The release groups from MusicBrainz. The iteration stops
+            early if there was an error while fetching the data.
     """
-    logger.debug(f"Browsing artist's release groups for mbid {artist_mbid}")
-
-    if release_type is None:
-        release_type = []
-    if secondary_type_exclude is None:
-        secondary_type_exclude = []
-    offset = 0
-    page = 1
-    release_groups = []
-    nb_results = browse_limit
-
-    # Continue browsing until we fetch all release groups
-    while nb_results >= browse_limit:
-        logger.debug(f"Fetching page number {page}")
+    logger.debug("Browsing artist's release groups for mbid {mbid}", mbid=artist_mbid)
+
+    browse_page = partial(
+        musicbrainzngs.browse_release_groups,
+        artist=artist_mbid,
+        includes=BROWSE_RELEASE_GROUP_INCLUDES,
+        release_type=release_type,
+        limit=browse_limit,
+    )
+    # Primary types are filtered by the API, but secondary types can't be excluded upstream
+    excluded_secondary_types = frozenset(
+        secondary_type.lower() for secondary_type in secondary_type_exclude
+    )
+    nb_yielded_release_groups = 0
 
-        try:
-            result = musicbrainzngs.browse_release_groups(
-                artist=artist_mbid,
-                includes=[IncludeOption.RATINGS],
-                release_type=release_type,
-                limit=browse_limit,
-                offset=offset,
-            )
-        except musicbrainzngs.WebServiceError:
-            logger.exception(
-                f"Error fetching release groups from MusicBrainz for mbid {artist_mbid}"
+    try:
+        for result in _browse_release_group_pages(browse_page, browse_limit):
+            release_groups = _exclude_secondary_types(
+                result.get("release-group-list", []), excluded_secondary_types
             )
-            return None
-        else:
-            page_release_groups: list[MBDataDict] = result.get("release-group-list", [])
-
-            filtered_release_groups = [
-                release_group
-                for release_group in page_release_groups
-                if not any(
-                    secondary_type.lower() in secondary_type_exclude
-                    for secondary_type in release_group.get(MBDataField.SECONDARY_TYPES, [])
-                )
-            ]
-            release_groups.extend(filtered_release_groups)
-
-            nb_results = len(page_release_groups)
-            offset += browse_limit
-            page += 1
-
-    logger.debug(f"{len(release_groups)} release groups found for mbid {artist_mbid}")
+            nb_yielded_release_groups += len(release_groups)
+            yield from release_groups
+    except musicbrainzngs.WebServiceError:
+        logger.exception(f"Error fetching release groups from MusicBrainz for mbid {artist_mbid}")
+        return
 
-    return release_groups
+    logger.debug(
+        "{nb} release groups found for mbid {mbid}", nb=nb_yielded_release_groups, mbid=artist_mbid
+    )
 
 
 # === Data extraction functions ===
@@ -254,16 +588,24 @@ def get_rating(entity_data: MBDataDict) -> float | None:
     Returns:
         float | None: The rating of the entity, or None if not available.
     """
-    rating_dict = entity_data.get("rating")
-
-    return float(rating_dict["rating"]) if rating_dict else None
+    # Entities without votes have a rating element without value
+    rating = rating_dict.get("rating") if (rating_dict := entity_data.get("rating")) else None
+    try:
+        return float(rating) if rating else None
+    except ValueError:
+        logger.warning(f"Invalid rating value: {rating}")
+        return None
 
 
 def get_start_year(entity_data: MBDataDict) -> int | None:
     """Extract the 4-digit start year from a MusicBrainz entity data dictionary."""
-    life_span_dict = entity_data.get("life-span")
-
-    return dateutil.parser.isoparse(life_span_dict["begin"]).year if life_span_dict else None
+    # The life span can have an end date without a begin date
+    begin = life_span.get("begin") if (life_span := entity_data.get("life-span")) else None
+    try:
+        return dateutil.parser.isoparse(begin).year if begin else None
+    except ValueError:
+        logger.warning(f"Invalid begin date: {begin}")
+        return None
 
 
 def extract_recording_mbids_and_track_number(
@@ -275,7 +617,9 @@ def extract_recording_mbids_and_track_number(
     The track number of each recording within release's medium and track is
     formatted as `<medium_position>.<track_position>` with zero-padding to
     allow lexicographical sorting. If the release only contains one medium,
-    the medium position is omitted.
+    the medium position is omitted. Recordings appearing on several tracks
+    (e.g. a bonus track repeated on another medium) are only yielded once,
+    with the track number of their first track in medium and track order.
 
     Args:
         release_data (MBDataDict): A release data dictionary.
@@ -286,23 +630,24 @@ def extract_recording_mbids_and_track_number(
     """
     medium_list = release_data["medium-list"]
     medium_padding = len(str(len(medium_list)))
+    seen_recording_mbids: set[MBID] = set()
 
     for medium in medium_list:
-        medium_position = int(medium["position"])
-
         track_list = medium["track-list"]
-        track_padding = len(str(len(track_list)))
 
-        for track in medium["track-list"]:
-            track_position = int(track["position"])
+        # The medium prefix and the track padding are the same for every track of the medium
+        if len(medium_list) == 1:
+            medium_prefix = ""
+        else:
+            medium_prefix = f"{int(medium['position']):0{medium_padding}}."
+        track_format_spec = f"0{len(str(len(track_list)))}"
+
+        for track in track_list:
             recording_mbid = track["recording"]["id"]
+            if recording_mbid in seen_recording_mbids:
+                continue
+            seen_recording_mbids.add(recording_mbid)
 
-            # Format the track number
-            if len(medium_list) == 1:
-                track_number = f"{track_position:0{track_padding}}"
-            else:
-                track_number = (
-                    f"{medium_position:0{medium_padding}}.{track_position:0{track_padding}}"
-                )
+            track_number = medium_prefix + format(int(track["position"]), track_format_spec)
 
             yield recording_mbid, track_number
@@ -5,9 +5,7 @@ from __future__ import annotations
 from enum import StrEnum
 from typing import Any, Literal, NotRequired, TypedDict
 
-from yarl import URL
-
-BASE_MUSICBRAINZ_URL = URL("https://musicbrainz.org")
+BASE_MUSICBRAINZ_URL = "https://musicbrainz.org"
 
 # %% === Types === #
 type MBID = str
@@ -8,18 +8,26 @@ Not all format functions have been tested.
 from __future__ import annotations
 
 import re
+import time
 from enum import StrEnum
-from typing import TYPE_CHECKING, Any, Literal, TypedDict
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Literal, TypedDict, override
 
 import notion_client
 from loguru import logger
 from notion_client import Client
+from notion_client.errors import APIErrorCode, APIResponseError
+
+from musicbrainz2notion.rate_limiter import SlidingWindowRateLimiter
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Callable, Iterable, Sequence
 
 
 OBJECT_ID_LENGTH = 32
+NOTION_MAX_RETRIES = 5
+NOTION_RATE_LIMIT_INTERVAL = 1  # Seconds
+NOTION_REQUEST_PER_INTERVAL = 3  # Notion API allows an average of 3 requests per second
 # === Types === #
 type PageId = str
 type DatabaseId = PageId
@@ -210,7 +218,7 @@ def format_annotations(
     underline: bool = False,
     code: bool = False,
     color: RichTextColor = RichTextColor.DEFAULT,
-) -> dict[AnnotationType, Any]:
+) -> dict[str, Any]:
     """
     Format the annotation object for a rich text entry.
 
@@ -227,20 +235,25 @@ def format_annotations(
             Notion API.
     """
     return {
-        AnnotationType.BOLD: bold,
-        AnnotationType.ITALIC: italic,
-        AnnotationType.STRIKETHROUGH: strikethrough,
-        AnnotationType.UNDERLINE: underline,
-        AnnotationType.CODE: code,
-        AnnotationType.COLOR: color,
+        "bold": bold,
+        "italic": italic,
+        "strikethrough": strikethrough,
+        "underline": underline,
+        "code": code,
+        "color": color,
     }
 
 
+# Shared by the text objects without annotations instead of rebuilding it for each
+# of them, must not be modified
+_DEFAULT_ANNOTATIONS = format_annotations()
+
+
 def format_text(
     content: str,
     annotations: dict[str, Any] | None = None,
     link: str | None = None,
-) -> dict[PropertyField, Any]:
+) -> dict[str, Any]:
     """
     Format a text-type rich text object for Notion API.
 
@@ -261,14 +274,14 @@ def format_text(
         content = content[:CONTENT_LENGTH_LIMIT]
 
     return {
-        PropertyField.TYPE: RichTextType.TEXT,
-        PropertyField.TEXT: {
-            PropertyField.CONTENT: content,
-            PropertyField.LINK: {PropertyField.URL: link} if link else None,
+        "type": RichTextType.TEXT,
+        "text": {
+            "content": content,
+            "link": {"url": link} if link else None,
         },
-        PropertyField.ANNOTATIONS: annotations or format_annotations(),
-        PropertyField.PLAIN_TEXT: content,
-        PropertyField.HREF: link,
+        "annotations": _DEFAULT_ANNOTATIONS if annotations is None else annotations,
+        "plain_text": content,
+        "href": link,
     }
 
 
@@ -278,7 +291,7 @@ def format_mention(
     annotations: dict[str, Any] | None = None,
     plain_text: str | None = None,
     link: str | None = None,
-) -> dict[PropertyField, Any]:
+) -> dict[str, Any]:
     """
     Format a mention-type rich text object for Notion API.
 
@@ -296,14 +309,14 @@ def format_mention(
         dict: A properly formatted rich text object for mentions in Notion API.
     """
     return {
-        PropertyField.TYPE: RichTextType.MENTION,
-        PropertyField.MENTION: {
-            PropertyField.TYPE: mention_type.value,
+        "type": RichTextType.MENTION,
+        "mention": {
+            "type": mention_type.value,
             mention_type.value: mention_value,
         },
-        PropertyField.ANNOTATIONS: annotations or format_annotations(),
-        PropertyField.PLAIN_TEXT: plain_text or "",
-        PropertyField.HREF: link,
+        "annotations": _DEFAULT_ANNOTATIONS if annotations is None else annotations,
+        "plain_text": plain_text or "",
+        "href": link,
     }
 
 
@@ -312,7 +325,7 @@ def format_equation(
     annotations: dict[str, Any] | None = None,
     plain_text: str | None = None,
     link: str | None = None,
-) -> dict[PropertyField, Any]:
+) -> dict[str, Any]:
     """
     Format an equation-type rich text object for Notion API.
 
@@ -328,17 +341,17 @@ def format_equation(
         dict: A properly formatted rich text object for equations in Notion API.
     """
     return {
-        PropertyField.TYPE: RichTextType.EQUATION,
-        PropertyField.EQUATION: {PropertyField.EXPRESSION: expression},
-        PropertyField.ANNOTATIONS: annotations or format_annotations(),
-        PropertyField.PLAIN_TEXT: plain_text or expression,
-        PropertyField.HREF: link,
+        "type": RichTextType.EQUATION,
+        "equation": {"expression": expression},
+        "annotations": _DEFAULT_ANNOTATIONS if annotations is None else annotations,
+        "plain_text": plain_text or expression,
+        "href": link,
     }
 
 
 def format_rich_text(
-    rich_text_list: list[dict[PropertyField, Any]],
-) -> dict[Literal[PropertyType.RICH_TEXT], list[dict[PropertyField, Any]]]:
+    rich_text_list: list[dict[str, Any]],
+) -> dict[Literal["rich_text"], list[dict[str, Any]]]:
     """
     Format a title property for Notion API.
 
@@ -349,12 +362,12 @@ def format_rich_text(
     Returns:
         dict: A properly formatted dictionary for a title property in Notion API.
     """
-    return {PropertyType.RICH_TEXT: rich_text_list}
+    return {"rich_text": rich_text_list}
 
 
 def format_title(
-    rich_text_list: list[dict[PropertyField, Any]],
-) -> dict[Literal[PropertyType.TITLE], list[dict[PropertyField, Any]]]:
+    rich_text_list: list[dict[str, Any]],
+) -> dict[Literal["title"], list[dict[str, Any]]]:
     """
     Format a title property for Notion API.
 
@@ -366,7 +379,7 @@ def format_title(
         dict: A properly formatted dictionary for a title property in Notion API.
     """
     return {
-        PropertyType.TITLE: rich_text_list,
+        "title": rich_text_list,
         # TODO: Check if we need to add "id" and "type" to the title property
         # PropertyField.ID: PagePropertyType.TITLE,
         # PropertyField.TYPE: PagePropertyType.TITLE,
@@ -377,7 +390,7 @@ def format_title(
 def format_external_file(
     name: str,
     url: str,
-) -> dict[PropertyField, Any]:
+) -> dict[str, Any]:
     """
     Format an external file property for Notion API.
 
@@ -389,9 +402,9 @@ def format_external_file(
         dict: A properly formatted external file object for Notion API.
     """
     return {
-        PropertyField.NAME: name,
-        PropertyField.TYPE: PropertyField.EXTERNAL,
-        PropertyField.EXTERNAL: {PropertyField.URL: url},
+        "name": name,
+        "type": PropertyField.EXTERNAL,
+        "external": {"url": url},
     }
 
 
@@ -399,7 +412,7 @@ def format_notion_file(
     name: str,
     url: str,
     expiry_time: str,
-) -> dict[PropertyField, Any]:
+) -> dict[str, Any]:
     """
     Format a Notion-hosted file property for Notion API.
 
@@ -412,26 +425,26 @@ def format_notion_file(
         dict: A properly formatted Notion-hosted file object for Notion API.
     """
     return {
-        PropertyField.NAME: name,
-        PropertyField.TYPE: PropertyField.FILE,
-        PropertyField.FILE: {PropertyField.URL: url, PropertyField.EXPIRY_TIME: expiry_time},
+        "name": name,
+        "type": PropertyField.FILE,
+        "file": {"url": url, "expiry_time": expiry_time},
     }
 
 
 def format_file(
-    file_list: list[dict[PropertyField, Any]],
-) -> dict[Literal[PropertyType.FILES], list[dict[PropertyField, Any]]]:
+    file_list: list[dict[str, Any]],
+) -> dict[Literal["files"], list[dict[str, Any]]]:
     """
     Format a files property for Notion API.
 
     Args:
-        file_list (list[dict[PropertyField, Any]]): A list of file objects
+        file_list (list[dict[str, Any]]): A list of file objects
             as content of the files property.
 
     Returns:
         dict: A properly formatted dictionary for a files property in Notion API.
     """
-    return {PropertyType.FILES: file_list}
+    return {"files": file_list}
 
 
 # %% === Page property formatting === #
@@ -489,7 +502,7 @@ def format_multi_select(
 
 def format_checkbox(
     value: bool,
-) -> dict[Literal[PropertyField.CHECKBOX], bool]:
+) -> dict[Literal["checkbox"], bool]:
     """
     Format a checkbox property for Notion API.
 
@@ -500,12 +513,12 @@ def format_checkbox(
         dict: A properly formatted dictionary for a checkbox property in
             Notion API.
     """
-    return {PropertyField.CHECKBOX: value}
+    return {"checkbox": value}
 
 
 def format_created_by(
     user_id: str,
-) -> dict[Literal[PropertyType.CREATED_BY], dict[Literal[PropertyField.ID], str]]:
+) -> dict[Literal["created_by"], dict[Literal["id"], str]]:
     """
     Format a created_by property for Notion API.
 
@@ -516,12 +529,12 @@ def format_created_by(
         dict: A properly formatted dictionary for a created_by property in
             Notion API.
     """
-    return {PropertyType.CREATED_BY: {PropertyField.ID: user_id}}
+    return {"created_by": {"id": user_id}}
 
 
 def format_created_time(
     value: str,
-) -> dict[Literal[PropertyType.CREATED_TIME], str]:
+) -> dict[Literal["created_time"], str]:
     """
     Format a created_time property for Notion API.
 
@@ -532,13 +545,11 @@ def format_created_time(
         dict: A properly formatted dictionary for a created_time property in
             Notion API.
     """
-    return {PropertyType.CREATED_TIME: value}
+    return {"created_time": value}
 
 
 # TODO: Check if it works
-def format_date(
-    start: str, end: str | None = None
-) -> dict[Literal[PropertyType.DATE], dict[str, str | None]]:
+def format_date(start: str, end: str | None = None) -> dict[Literal["date"], dict[str, str | None]]:
     """
     Format a date property for Notion API.
 
@@ -550,12 +561,12 @@ def format_date(
     Returns:
         dict: A properly formatted dictionary for a date property in Notion API.
     """
-    return {PropertyType.DATE: {PropertyField.START: start, PropertyField.END: end}}
+    return {"date": {"start": start, "end": end}}
 
 
 def format_email(
     email: str,
-) -> dict[Literal[PropertyType.EMAIL], str]:
+) -> dict[Literal["email"], str]:
     """
     Format an email property for Notion API.
 
@@ -566,12 +577,12 @@ def format_email(
         dict: A properly formatted dictionary for an email property in
             Notion API.
     """
-    return {PropertyType.EMAIL: email}
+    return {"email": email}
 
 
 def format_number[T: int | float | None](
     value: T,
-) -> dict[Literal[PropertyType.NUMBER], T]:
+) -> dict[Literal["number"], T]:
     """
     Format a number property for Notion API.
 
@@ -582,10 +593,10 @@ def format_number[T: int | float | None](
         dict: A properly formatted dictionary for a number property in
             Notion API.
     """
-    return {PropertyType.NUMBER: value}
+    return {"number": value}
 
 
-def format_url(url: str) -> dict[Literal[PropertyType.URL], str]:
+def format_url(url: str) -> dict[Literal["url"], str]:
     """
     Format an email property for Notion API.
 
@@ -595,12 +606,12 @@ def format_url(url: str) -> dict[Literal[PropertyType.URL], str]:
     Returns:
         dict: A properly formatted dictionary for aa url property in Notion API.
     """
-    return {PropertyType.URL: url}
+    return {"url": url}
 
 
 def format_relation(
     page_ids: list[str],
-) -> dict[Literal[PropertyType.RELATION], list[dict[Literal[PropertyField.ID], PageId]]]:
+) -> dict[Literal["relation"], list[dict[Literal["id"], PageId]]]:
     """
     Format a relation property for Notion API.
 
@@ -610,12 +621,12 @@ def format_relation(
     Returns:
         dict: A properly formatted relation property for Notion API.
     """
-    return {PropertyType.RELATION: [{PropertyField.ID: page_id} for page_id in page_ids]}
+    return {"relation": [{"id": page_id} for page_id in page_ids]}
 
 
 def format_emoji(
     emoji: str,
-) -> dict[Literal[PropertyField.TYPE, PropertyField.EMOJI], str]:
+) -> dict[Literal["type", "emoji"], str]:
     """
     Format a page emoji for Notion API.
 
@@ -626,8 +637,8 @@ def format_emoji(
         dict: A properly formatted dictionary for a page emoji in Notion API.
     """
     return {
-        PropertyField.TYPE: PropertyField.EMOJI,
-        PropertyField.EMOJI: emoji,
+        "type": PropertyField.EMOJI,
+        "emoji": emoji,
     }
 
 
@@ -644,6 +655,10 @@ def extract_plain_text(rich_text_property: list[dict[str, Any]]) -> str:
     Returns:
         str: The concatenated plain text from the rich text property.
     """
+    # Most properties, like mbids, have a single text object
+    if len(rich_text_property) == 1:
+        return rich_text_property[0][PropertyField.PLAIN_TEXT]
+
     full_text = "".join([
         text_object[PropertyField.PLAIN_TEXT] for text_object in rich_text_property
     ])
@@ -716,6 +731,96 @@ def has_properties_database(props: Iterable[str], database: DatabaseDict) -> boo
     return all(prop in database["properties"] for prop in props)
 
 
+def get_database_property_id(client: Client, database_id: DatabaseId, prop_name: str) -> str:
+    """
+    Return the ID of a property of the database.
+
+    Args:
+        client: Notion client with access to the database.
+        database_id: ID of the database.
+        prop_name: Name of the property.
+
+    Returns:
+        The ID of the property, used to select the properties returned when
+            querying the database.
+    """
+    database: DatabaseDict = client.databases.retrieve(database_id)  # pyright: ignore[reportAssignmentType]
+    return database["properties"][prop_name][PropertyField.ID]  # pyright: ignore[reportArgumentType]
+
+
+# === Requests === #
+def retry_on_rate_limit[**P, T](func: Callable[P, T]) -> Callable[P, T]:
+    """
+    Retry the decorated function when the rate limit of the Notion API is reached.
+
+    Before each retry, the function waits for the delay given by the
+    `Retry-After` header of the response, or for an exponential backoff if it
+    is missing.
+
+    Args:
+        func: The function sending requests to the Notion API.
+
+    Returns:
+        The function, retried at most NOTION_MAX_RETRIES times when rate
+            limited.
+    """
+
+    @wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        nb_retries = 0
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except APIResponseError as e:
+                if e.code != APIErrorCode.RateLimited or nb_retries >= NOTION_MAX_RETRIES:
+                    raise
+                delay = float(e.headers.get("Retry-After", 2**nb_retries))
+                logger.warning(f"Notion API rate limit reached, retrying in {delay} seconds.")
+                time.sleep(delay)
+                nb_retries += 1
+
+    return wrapper
+
+
+class RateLimitedClient(Client):
+    """
+    Notion client waiting before each request to stay under the rate limit of the API.
+
+    The requests sent by all the threads sharing the client are spaced out
+    instead of being rejected by the API. Requests rejected anyway, for
+    example when the token is shared with another integration, are retried.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        rate_limiter: SlidingWindowRateLimiter | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            *args: Positional arguments passed to `notion_client.Client`.
+            rate_limiter (SlidingWindowRateLimiter | None): The rate limiter of
+                the requests. Defaults to NOTION_REQUEST_PER_INTERVAL requests
+                every NOTION_RATE_LIMIT_INTERVAL seconds.
+            **kwargs: Keyword arguments passed to `notion_client.Client`.
+        """
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter or SlidingWindowRateLimiter(
+            interval=NOTION_RATE_LIMIT_INTERVAL, max_calls=NOTION_REQUEST_PER_INTERVAL
+        )
+
+    # The arguments are forwarded as is to support the signatures of all the
+    # versions of notion-client
+    @override
+    @retry_on_rate_limit
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        self.rate_limiter.acquire()
+        return super().request(*args, **kwargs)
+
+
 # === Validators ===
 class InvalidNotionAPIKeyError(ValueError):
     """The Notion API key is invalid."""
@@ -0,0 +1,41 @@
+"""Rate limiting of the requests sent to web APIs."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from threading import Lock
+
+
+class SlidingWindowRateLimiter:
+    """
+    Thread-safe rate limiter allowing a maximum number of calls in any time window.
+
+    Contrary to the rate limiter of musicbrainzngs, the lock is only held
+    while waiting for a free slot and not during the request itself, so slow
+    responses don't prevent other requests from being sent.
+    """
+
+    def __init__(self, interval: float, max_calls: int) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            interval (float): Length of the time window in seconds.
+            max_calls (int): Maximum number of calls in any time window.
+        """
+        self.interval = interval
+        self.max_calls = max_calls
+        self._call_times: deque[float] = deque()
+        self._lock = Lock()
+
+    def acquire(self) -> None:
+        """Block until a call can be made without exceeding the rate limit."""
+        with self._lock:
+            now = time.monotonic()
+            if len(self._call_times) >= self.max_calls:
+                wait_time = self._call_times.popleft() + self.interval - now
+                if wait_time > 0:
+                    time.sleep(wait_time)
+                    now = time.monotonic()
+            self._call_times.append(now)
@@ -0,0 +1,105 @@
+"""Disk cache of the responses of web APIs."""
+
+from __future__ import annotations
+
+import pickle  # noqa: S403
+import sqlite3
+import time
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlencode
+
+if TYPE_CHECKING:
+    from datetime import timedelta
+    from pathlib import Path
+
+
+class ResponseCache:
+    """
+    Thread-safe SQLite cache of the parsed responses of web APIs.
+
+    Responses are stored pickled, which is much faster to load than json for
+    large nested dictionaries such as the ones returned by musicbrainzngs.
+    They are keyed by a string, for example the request path and its sorted
+    arguments, and expire after a given time.
+    """
+
+    def __init__(self, path: Path, expire_after: timedelta) -> None:
+        """
+        Initialize the cache, creating the database if needed.
+
+        Args:
+            path (Path): Path to the SQLite database file.
+            expire_after (timedelta): Time after which cached responses are
+                fetched again.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.expire_after = expire_after
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, response BLOB NOT NULL, created_at REAL NOT NULL)"
+            )
+
+    def clear(self) -> None:
+        """Remove all the cached responses."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def prune_expired(self) -> None:
+        """Remove the expired responses to keep the database small."""
+        expiration_time = time.time() - self.expire_after.total_seconds()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM responses WHERE created_at < ?", (expiration_time,)
+            )
+
+    @staticmethod
+    def make_key(path: str, args: dict[str, Any] | None) -> str:
+        """
+        Return the cache key of a request.
+
+        Args:
+            path (str): The path of the request endpoint.
+            args (dict[str, Any] | None): The arguments of the request.
+
+        Returns:
+            str: The cache key of the request.
+        """
+        return f"{path}?{urlencode(sorted((args or {}).items()))}"
+
+    def get(self, key: str) -> Any | None:
+        """
+        Return the cached response of a request, or None if it is missing or expired.
+
+        Args:
+            key (str): The cache key of the request.
+
+        Returns:
+            Any | None: The parsed response, None if it is not cached.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.expire_after.total_seconds():
+            return None
+
+        return pickle.loads(row[0])  # noqa: S301
+
+    def set(self, key: str, response: Any) -> None:
+        """
+        Cache the response of a request.
+
+        Args:
+            key (str): The cache key of the request.
+            response (Any): The parsed response to cache.
+        """
+        serialized_response = pickle.dumps(response, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, serialized_response, time.time()),
+            )
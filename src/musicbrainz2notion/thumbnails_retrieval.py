@@ -3,30 +3,121 @@
 from __future__ import annotations
 
 import operator
-import os
 import urllib.parse
+from datetime import timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-import dotenv
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
 
+from musicbrainz2notion.__about__ import PROJECT_ROOT
 from musicbrainz2notion.config import global_settings
-from musicbrainz2notion.environment import EnvironmentVar
 from musicbrainz2notion.musicbrainz_utils import MBID, CoverSize, EntityType, MBDataDict
+from musicbrainz2notion.response_cache import ResponseCache
 
-dotenv.load_dotenv()
-FANART_API_KEY = os.getenv(EnvironmentVar.FANART_API_KEY)
+if TYPE_CHECKING:
+    from pathlib import Path
 
 WIKIDATA_API_URL = "https://www.wikidata.org/w/api.php"
 MB_COVER_ART_ARCHIVE_URL = "https://coverartarchive.org/"
 WIKIDATA_BASE_IMAGE_URL = "https://commons.wikimedia.org/wiki/Special:FilePath"
 BASE_FANART_URL = "https://webservice.fanart.tv/v3/music"
+# Number of cover URLs kept in memory, a release group can be synchronized
+# several times in a run when it is added as a related page
+COVER_URL_CACHE_SIZE = 4096
+# Resolved cover URLs rarely change, so they are also kept on disk between runs
+COVER_URL_CACHE_PATH = PROJECT_ROOT / "cache" / "cover_urls.sqlite"
+COVER_URL_CACHE_EXPIRATION = timedelta(days=30)
+
+# Built once instead of formatting the entity type for each cover
+_RELEASE_GROUP_COVER_URL_PREFIX = f"{MB_COVER_ART_ARCHIVE_URL}{EntityType.RELEASE_GROUP.value}/"
+
+# Shared session so that the connections to the thumbnail hosts (one pool per
+# host) are reused between requests and threads
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+
+# Disk cache of the resolved cover URLs, None until initialized or if disabled
+_cover_url_cache: ResponseCache | None = None
+
+
+def initialize_cover_url_cache(
+    cache_expiration: timedelta | None = COVER_URL_CACHE_EXPIRATION,
+) -> None:
+    """
+    Open the disk cache of the resolved cover URLs.
+
+    Args:
+        cache_expiration (timedelta | None): Time after which the cover URLs
+            cached on disk are resolved again. If None, cover URLs are not
+            cached on disk. Defaults to COVER_URL_CACHE_EXPIRATION.
+    """
+    global _cover_url_cache  # noqa: PLW0603
+
+    if cache_expiration is None:
+        _cover_url_cache = None
+        return
+
+    _cover_url_cache = ResponseCache(COVER_URL_CACHE_PATH, expire_after=cache_expiration)
+    _cover_url_cache.prune_expired()
+
+
+def clear_cover_url_cache(path: Path = COVER_URL_CACHE_PATH) -> None:
+    """
+    Remove all the resolved cover URLs kept on disk and in memory.
+
+    Args:
+        path (Path): Path to the SQLite database of the cache.
+    """
+    ResponseCache(path, expire_after=COVER_URL_CACHE_EXPIRATION).clear()
+    _resolve_release_group_cover_url.cache_clear()
+    logger.info(f"Cover URL cache cleared.")
+
+
+@lru_cache(maxsize=COVER_URL_CACHE_SIZE)
+def _resolve_release_group_cover_url(release_group_mbid: MBID, size: CoverSize) -> str:
+    """
+    Resolve the direct URL of the front cover of a release group, raising on failure.
+
+    Failures raise instead of returning None since exceptions are not
+    memoized, so that they are retried by the next calls.
+
+    Args:
+        release_group_mbid (MBID): The MusicBrainz ID (MBID) of the release group.
+        size (CoverSize): The size of the cover image in pixel.
+
+    Returns:
+        str: The final direct URL to the cover image.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails.
+    """
+    redirect_url = f"{_RELEASE_GROUP_COVER_URL_PREFIX}{release_group_mbid}/front-{size}"
+    cover_url_cache = _cover_url_cache
+    if cover_url_cache is not None and (cover_url := cover_url_cache.get(redirect_url)):
+        return cover_url
+
+    # Get the final url
+    response = _session.head(
+        redirect_url, allow_redirects=True, timeout=global_settings.REQUEST_TIMEOUT
+    )
+    response.raise_for_status()
+    if cover_url_cache is not None:
+        cover_url_cache.set(redirect_url, response.url)
+
+    return response.url
 
 
 def get_release_group_cover_url(release_group_mbid: MBID, size: CoverSize) -> str | None:
     """
     Retrieve the direct URL for the front cover art of a release group from the Cover Art Archive.
 
+    Resolved URLs are kept in memory, and cached on disk if the cache was
+    initialized with initialize_cover_url_cache. Failures are not cached.
+
     Args:
         release_group_mbid (MBID): The MusicBrainz ID (MBID) of the release group.
         size (CoverSize): The size of the cover image in pixel.
@@ -34,22 +125,12 @@ def get_release_group_cover_url(release_group_mbid: MBID, size: CoverSize) -> st
     Returns:
         str | None: The final direct URL to the cover image, or None if the request fails.
     """
-    redirect_url = (
-        f"{MB_COVER_ART_ARCHIVE_URL}/{EntityType.RELEASE_GROUP}/{release_group_mbid}/front-{size}"
-    )
-
-    # Get the final url
     try:
-        response = requests.head(
-            redirect_url, allow_redirects=True, timeout=global_settings.REQUEST_TIMEOUT
-        )
-        response.raise_for_status()
+        return _resolve_release_group_cover_url(release_group_mbid, size)
     except requests.exceptions.RequestException as e:
         logger.warning(f"Could not get cover art for release group {release_group_mbid}: {e}")
         return None
 
-    return response.url
-
 
 def extract_wikidata_id(entity_data: MBDataDict) -> str | None:
     """
@@ -91,7 +172,7 @@ def fetch_wikidata_image_url(wikidata_id: str) -> str | None:
     }
 
     try:
-        response = requests.get(
+        response = _session.get(
             WIKIDATA_API_URL, params=params, timeout=global_settings.REQUEST_TIMEOUT
         )
         response.raise_for_status()
@@ -114,7 +195,7 @@ def fetch_wikidata_image_url(wikidata_id: str) -> str | None:
     encoded_filename = urllib.parse.quote(image_filename.replace(" ", "_"))
     image_url = f"{WIKIDATA_BASE_IMAGE_URL}/{encoded_filename}"
 
-    logger.debug(f"Fetched image URL: {image_url}")
+    logger.debug("Fetched image URL: {image_url}", image_url=image_url)
 
     return image_url
 
@@ -141,7 +222,7 @@ def fetch_fanart_tv_artist_thumbnail(mbid: str, fanart_api_key: str) -> str | No
     }
 
     try:
-        response = requests.get(url, headers=headers, timeout=global_settings.REQUEST_TIMEOUT)
+        response = _session.get(url, headers=headers, timeout=global_settings.REQUEST_TIMEOUT)
         response.raise_for_status()
     except requests.exceptions.RequestException as e:
         logger.warning(f"Error fetching artist image from Fanart.tv: {e}")
@@ -0,0 +1,117 @@
+"""Tests for the database_entities module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+
+from musicbrainz2notion.database_entities import Artist
+from musicbrainz2notion.musicbrainz_utils import EntityType
+
+if TYPE_CHECKING:
+    from musicbrainz2notion.database_entities import SyncHashes
+
+ARTIST_MBID = "artist-mbid"
+DATABASE_IDS = {
+    EntityType.ARTIST: "artist-db",
+    EntityType.RELEASE: "release-db",
+    EntityType.RECORDING: "track-db",
+}
+
+
+@pytest.fixture
+def artist() -> Artist:
+    return Artist(mbid=ARTIST_MBID, name="Artist")
+
+
+@pytest.fixture
+def notion_api() -> MagicMock:
+    notion_api = MagicMock()
+    notion_api.pages.create.return_value = {"id": "new-page"}
+    notion_api.pages.update.return_value = {"id": "artist-page"}
+    return notion_api
+
+
+def synchronize(
+    artist: Artist,
+    notion_api: MagicMock,
+    mbid_to_page_id_map: dict[str, str],
+    content_hashes: SyncHashes,
+) -> None:
+    artist.synchronize_notion_page(
+        notion_api=notion_api,
+        database_ids=DATABASE_IDS,
+        mbid_to_page_id_map=mbid_to_page_id_map,
+        min_nb_tags=3,
+        fanart_api_key=None,
+        content_hashes=content_hashes,
+    )
+
+
+def updated_page_ids(notion_api: MagicMock) -> list[str]:
+    return [call.kwargs["page_id"] for call in notion_api.pages.update.call_args_list]
+
+
+def test_unchanged_page_is_skipped(artist: Artist, notion_api: MagicMock) -> None:
+    mbid_to_page_id_map = {ARTIST_MBID: "artist-page"}
+    content_hashes: SyncHashes = {}
+
+    synchronize(artist, notion_api, mbid_to_page_id_map, content_hashes)
+    synchronize(artist, notion_api, mbid_to_page_id_map, content_hashes)
+
+    notion_api.pages.update.assert_called_once()
+    notion_api.pages.create.assert_not_called()
+    assert content_hashes["artist-db"][ARTIST_MBID][0] == "artist-page"
+
+
+def test_changed_page_is_updated(artist: Artist, notion_api: MagicMock) -> None:
+    mbid_to_page_id_map = {ARTIST_MBID: "artist-page"}
+    content_hashes: SyncHashes = {"artist-db": {ARTIST_MBID: ("artist-page", "outdated-hash")}}
+
+    synchronize(artist, notion_api, mbid_to_page_id_map, content_hashes)
+
+    notion_api.pages.update.assert_called_once()
+    assert content_hashes["artist-db"][ARTIST_MBID][1] != "outdated-hash"
+
+
+def test_recreated_page_is_updated(artist: Artist, notion_api: MagicMock) -> None:
+    content_hashes: SyncHashes = {}
+    synchronize(artist, notion_api, {ARTIST_MBID: "old-page"}, content_hashes)
+
+    # The page was deleted and created again in Notion since the last synchronization
+    synchronize(artist, notion_api, {ARTIST_MBID: "artist-page"}, content_hashes)
+
+    assert updated_page_ids(notion_api) == ["old-page", "artist-page"]
+    assert content_hashes["artist-db"][ARTIST_MBID][0] == "artist-page"
+
+
+def test_hashes_are_scoped_to_the_database(artist: Artist, notion_api: MagicMock) -> None:
+    content_hashes: SyncHashes = {}
+    synchronize(artist, notion_api, {ARTIST_MBID: "artist-page"}, content_hashes)
+    other_database_ids = {**DATABASE_IDS, EntityType.ARTIST: "other-artist-db"}
+
+    artist.synchronize_notion_page(
+        notion_api=notion_api,
+        database_ids=other_database_ids,
+        mbid_to_page_id_map={ARTIST_MBID: "artist-page"},
+        min_nb_tags=3,
+        fanart_api_key=None,
+        content_hashes=content_hashes,
+    )
+
+    assert updated_page_ids(notion_api) == ["artist-page", "artist-page"]
+    assert set(content_hashes) == {"artist-db", "other-artist-db"}
+
+
+def test_missing_page_is_created(artist: Artist, notion_api: MagicMock) -> None:
+    mbid_to_page_id_map: dict[str, str] = {}
+    content_hashes: SyncHashes = {"artist-db": {ARTIST_MBID: ("deleted-page", "hash")}}
+
+    synchronize(artist, notion_api, mbid_to_page_id_map, content_hashes)
+
+    notion_api.pages.create.assert_called_once()
+    notion_api.pages.update.assert_not_called()
+    assert mbid_to_page_id_map[ARTIST_MBID] == "new-page"
+    assert content_hashes["artist-db"][ARTIST_MBID][0] == "new-page"
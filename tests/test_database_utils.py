@@ -0,0 +1,145 @@
+"""Tests for the database_utils module."""
+
+from __future__ import annotations
+
+from itertools import batched
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from musicbrainz2notion import database_utils
+from musicbrainz2notion.canonical_data_processing import (
+    CANONICAL_RELEASE_FILE_NAME,
+    load_canonical_release_data,
+)
+from musicbrainz2notion.database_utils import (
+    CanonicalReleaseLookup,
+    get_release_map_with_auto_update,
+    load_sync_hashes,
+    save_fallback_canonical_releases,
+    save_sync_hashes,
+)
+from musicbrainz2notion.musicbrainz_utils import CanonicalDataHeader
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from musicbrainz2notion.database_entities import SyncHashes
+
+
+def test_sync_hashes_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "data" / "sync_hashes.json"
+    content_hashes: SyncHashes = {
+        "artist-db": {"artist-mbid": ("artist-page", "hash-1")},
+        "release-db": {
+            "release-mbid-1": ("release-page-1", "hash-2"),
+            "release-mbid-2": ("release-page-2", "hash-3"),
+        },
+    }
+
+    save_sync_hashes(content_hashes, path)
+
+    assert load_sync_hashes(path) == content_hashes
+
+
+def test_load_sync_hashes_missing_file(tmp_path: Path) -> None:
+    assert load_sync_hashes(tmp_path / "sync_hashes.json") == {}
+
+
+def test_load_sync_hashes_invalid_json(tmp_path: Path) -> None:
+    path = tmp_path / "sync_hashes.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    assert load_sync_hashes(path) == {}
+
+
+def test_load_sync_hashes_unexpected_format(tmp_path: Path) -> None:
+    path = tmp_path / "sync_hashes.json"
+    # Hashes keyed by MBID only, without database and page IDs
+    path.write_text('{"artist-mbid": "hash-1"}', encoding="utf-8")
+
+    assert load_sync_hashes(path) == {}
+
+
+def canonical_release_df(releases: dict[str, str]) -> pd.DataFrame:
+    return pd.DataFrame({
+        CanonicalDataHeader.RELEASE_GROUP_MBID: list(releases.keys()),
+        CanonicalDataHeader.CANONICAL_RELEASE_MBID: list(releases.values()),
+    })
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    csv_dir = tmp_path / "musicbrainz-canonical-dump-20240101-000000" / "canonical"
+    csv_dir.mkdir(parents=True)
+    canonical_release_df({"rg-0": "rel-0"}).to_pickle(csv_dir / CANONICAL_RELEASE_FILE_NAME)
+    return tmp_path
+
+
+@pytest.fixture
+def update_canonical_data(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    update_canonical_data = MagicMock(return_value=canonical_release_df({"rg-0": "rel-0"}))
+    monkeypatch.setattr(database_utils, "update_canonical_data", update_canonical_data)
+
+    def fetch_release_group_data(release_group_mbid: str) -> dict[str, Any]:
+        return {"release-list": [{"id": f"fallback-{release_group_mbid}"}]}
+
+    monkeypatch.setattr(database_utils, "fetch_release_group_data", fetch_release_group_data)
+    return update_canonical_data
+
+
+def test_canonical_data_updated_once_per_run(
+    data_dir: Path, update_canonical_data: MagicMock
+) -> None:
+    canonical_release_lookup = CanonicalReleaseLookup({"rg-0": "rel-0"})
+    release_group_mbids = [f"rg-{i}" for i in range(200)]
+
+    release_maps = [
+        get_release_map_with_auto_update(list(batch), data_dir, canonical_release_lookup)
+        for batch in batched(release_group_mbids, 64)  # noqa: B911
+    ]
+
+    update_canonical_data.assert_called_once()
+    assert release_maps[0]["rg-0"] == "rel-0"
+    assert release_maps[-1]["rg-199"] == "fallback-rg-199"
+    # The fallback releases are only saved at the end of the run
+    assert len(load_canonical_release_data(data_dir)) == 1
+
+
+def test_lookup_already_updated_uses_fallback(
+    data_dir: Path, update_canonical_data: MagicMock
+) -> None:
+    canonical_release_lookup = CanonicalReleaseLookup({"rg-0": "rel-0"}, is_updated=True)
+
+    release_map = get_release_map_with_auto_update(["rg-1"], data_dir, canonical_release_lookup)
+
+    update_canonical_data.assert_not_called()
+    assert release_map == {"rg-1": "fallback-rg-1"}
+
+
+@pytest.mark.usefixtures("update_canonical_data")
+def test_fallback_canonical_releases_saved(data_dir: Path) -> None:
+    canonical_release_lookup = CanonicalReleaseLookup({"rg-0": "rel-0"})
+    for release_group_mbids in (["rg-1"], ["rg-2", "rg-3"]):
+        _ = get_release_map_with_auto_update(
+            release_group_mbids, data_dir, canonical_release_lookup
+        )
+
+    save_fallback_canonical_releases(canonical_release_lookup, data_dir)
+
+    saved_df = load_canonical_release_data(data_dir)
+    assert dict(
+        zip(
+            saved_df[CanonicalDataHeader.RELEASE_GROUP_MBID],
+            saved_df[CanonicalDataHeader.CANONICAL_RELEASE_MBID],
+            strict=True,
+        )
+    ) == {
+        "rg-0": "rel-0",
+        "rg-1": "fallback-rg-1",
+        "rg-2": "fallback-rg-2",
+        "rg-3": "fallback-rg-3",
+    }
+    assert not canonical_release_lookup.fallback_releases
@@ -0,0 +1,48 @@
+"""Tests for the keyed_lock module."""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from musicbrainz2notion.keyed_lock import KeyedLock
+
+
+def test_same_key_is_serialized() -> None:
+    keyed_lock: KeyedLock[str] = KeyedLock()
+    nb_holders = 0
+    max_nb_holders = 0
+
+    def hold_key(key: str) -> None:
+        nonlocal nb_holders, max_nb_holders
+        with keyed_lock.hold(key):
+            nb_holders += 1
+            max_nb_holders = max(max_nb_holders, nb_holders)
+            time.sleep(0.01)
+            nb_holders -= 1
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        _ = list(executor.map(hold_key, ["key"] * 8))
+
+    assert max_nb_holders == 1
+
+
+def test_different_keys_are_not_blocked() -> None:
+    keyed_lock: KeyedLock[str] = KeyedLock()
+
+    def hold_other_key() -> bool:
+        with keyed_lock.hold("key-2"):
+            return True
+
+    with keyed_lock.hold("key-1"), ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(hold_other_key).result(timeout=1)
+
+
+def test_unused_locks_are_dropped() -> None:
+    keyed_lock: KeyedLock[str] = KeyedLock()
+
+    with keyed_lock.hold("key-1"), keyed_lock.hold("key-2"):
+        assert len(keyed_lock._locks) == 2  # pyright: ignore[reportPrivateUsage]  # noqa: PLR2004
+
+    assert not keyed_lock._locks  # pyright: ignore[reportPrivateUsage]
+    assert not keyed_lock._nb_users  # pyright: ignore[reportPrivateUsage]
@@ -0,0 +1,129 @@
+"""Tests for the musicbrainz_data_retrieval module."""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from unittest.mock import MagicMock, call
+
+import httpx
+import musicbrainzngs  # pyright: ignore[reportMissingTypeStubs]
+import musicbrainzngs.musicbrainz  # pyright: ignore[reportMissingTypeStubs]
+import pytest
+
+from musicbrainz2notion.musicbrainz_data_retrieval import (
+    MB_MAX_RETRIES,
+    MB_RETRY_DELAY,
+    _get_mb_response,  # pyright: ignore[reportPrivateUsage]  # noqa: PLC2701
+    _SingleFlightCache,  # pyright: ignore[reportPrivateUsage]  # noqa: PLC2701
+)
+
+
+@pytest.fixture
+def sleep(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    sleep = MagicMock()
+    monkeypatch.setattr(time, "sleep", sleep)
+    monkeypatch.setattr(musicbrainzngs.musicbrainz, "parser_fun", lambda content: content)  # pyright: ignore[reportUnknownLambdaType]
+    return sleep
+
+
+def mock_http_client(responses: list[httpx.Response]) -> httpx.Client:
+    remaining_responses = iter(responses)
+    return httpx.Client(transport=httpx.MockTransport(lambda _request: next(remaining_responses)))
+
+
+def test_retries_are_rate_limited(sleep: MagicMock) -> None:
+    rate_limiter = MagicMock()
+    http_client = mock_http_client([
+        httpx.Response(503, headers={"Retry-After": "5"}),
+        httpx.Response(503),
+        httpx.Response(200, content=b"data"),
+    ])
+
+    response = _get_mb_response(http_client, rate_limiter, "artist/mbid", None)
+
+    assert response == b"data"
+    assert rate_limiter.acquire.call_count == len(sleep.call_args_list) + 1
+    # The Retry-After header is honoured, with an increasing delay without it
+    assert [call.args[0] for call in sleep.call_args_list] == [5.0, 2 * MB_RETRY_DELAY]
+
+
+@pytest.mark.usefixtures("sleep")
+def test_retries_give_up() -> None:
+    rate_limiter = MagicMock()
+    http_client = mock_http_client([httpx.Response(503)] * MB_MAX_RETRIES)
+
+    with pytest.raises(musicbrainzngs.NetworkError):
+        _get_mb_response(http_client, rate_limiter, "artist/mbid", None)
+
+    assert rate_limiter.acquire.call_count == MB_MAX_RETRIES
+
+
+@pytest.mark.usefixtures("sleep")
+def test_client_error_not_retried() -> None:
+    rate_limiter = MagicMock()
+    http_client = mock_http_client([httpx.Response(404)])
+
+    with pytest.raises(musicbrainzngs.ResponseError):
+        _get_mb_response(http_client, rate_limiter, "artist/mbid", None)
+
+    rate_limiter.acquire.assert_called_once()
+
+
+def test_concurrent_calls_fetch_once() -> None:
+    fetch_started = Event()
+    release_fetch = Event()
+
+    def fetch(mbid: str) -> dict[str, str]:
+        fetch_started.set()
+        _ = release_fetch.wait(timeout=5)
+        return {"id": mbid}
+
+    fetch_func = MagicMock(side_effect=fetch)
+    fetch_data = _SingleFlightCache(fetch_func)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(fetch_data, "mbid") for _ in range(8)]
+        _ = fetch_started.wait(timeout=5)
+        release_fetch.set()
+
+    assert [future.result() for future in futures] == [{"id": "mbid"}] * 8
+    fetch_func.assert_called_once_with("mbid")
+
+
+def test_failed_fetch_not_memoized() -> None:
+    fetch_func = MagicMock(side_effect=[None, {"id": "mbid"}])
+    fetch_data = _SingleFlightCache(fetch_func)
+
+    assert fetch_data("mbid") is None
+    assert fetch_data("mbid") == {"id": "mbid"}
+    assert fetch_data("mbid") == {"id": "mbid"}
+    assert fetch_func.call_args_list == [call("mbid")] * 2
+
+
+def test_least_recently_used_evicted() -> None:
+    fetch_func = MagicMock(side_effect=lambda mbid: {"id": mbid})  # pyright: ignore[reportUnknownLambdaType]
+    fetch_data = _SingleFlightCache(fetch_func, maxsize=2)
+
+    _ = fetch_data("mbid-1")
+    _ = fetch_data("mbid-2")
+    _ = fetch_data("mbid-1")  # mbid-2 becomes the least recently used
+    _ = fetch_data("mbid-3")
+    fetch_func.reset_mock()
+
+    _ = fetch_data("mbid-1")
+    _ = fetch_data("mbid-2")
+
+    fetch_func.assert_called_once_with("mbid-2")
+
+
+def test_cache_clear() -> None:
+    fetch_func = MagicMock(side_effect=lambda mbid: {"id": mbid})  # pyright: ignore[reportUnknownLambdaType]
+    fetch_data = _SingleFlightCache(fetch_func)
+    _ = fetch_data("mbid")
+
+    fetch_data.cache_clear()
+    _ = fetch_data("mbid")
+
+    assert fetch_func.call_args_list == [call("mbid")] * 2
@@ -0,0 +1,77 @@
+"""Tests for the notion_utils module."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from notion_client import Client
+from notion_client.errors import APIErrorCode, APIResponseError
+
+from musicbrainz2notion.notion_utils import (
+    NOTION_MAX_RETRIES,
+    RateLimitedClient,
+    retry_on_rate_limit,
+)
+
+
+def rate_limited_error(retry_after: str | None = None) -> APIResponseError:
+    headers = {} if retry_after is None else {"Retry-After": retry_after}
+    return APIResponseError(
+        httpx.Response(429, headers=headers), "Rate limited", APIErrorCode.RateLimited
+    )
+
+
+@pytest.fixture
+def sleep(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    sleep = MagicMock()
+    monkeypatch.setattr("musicbrainz2notion.notion_utils.time.sleep", sleep)
+    return sleep
+
+
+def test_retry_delay_from_header_or_backoff(sleep: MagicMock) -> None:
+    func = MagicMock(side_effect=[rate_limited_error("3"), rate_limited_error(), "response"])
+
+    assert retry_on_rate_limit(func)("arg", key="value") == "response"
+
+    assert [call.args[0] for call in sleep.call_args_list] == [3.0, 2.0]
+    func.assert_called_with("arg", key="value")
+
+
+@pytest.mark.usefixtures("sleep")
+def test_retry_gives_up() -> None:
+    error = rate_limited_error()
+    func = MagicMock(side_effect=error)
+
+    with pytest.raises(APIResponseError) as exc_info:
+        retry_on_rate_limit(func)()
+
+    assert exc_info.value is error
+    assert func.call_count == NOTION_MAX_RETRIES + 1
+
+
+def test_other_errors_not_retried(sleep: MagicMock) -> None:
+    func = MagicMock(
+        side_effect=APIResponseError(httpx.Response(404), "Not found", APIErrorCode.ObjectNotFound)
+    )
+
+    with pytest.raises(APIResponseError):
+        retry_on_rate_limit(func)()
+
+    func.assert_called_once()
+    sleep.assert_not_called()
+
+
+@pytest.mark.usefixtures("sleep")
+def test_client_rate_limits_each_try(monkeypatch: pytest.MonkeyPatch) -> None:
+    client_request = MagicMock(side_effect=[rate_limited_error("1"), "response"])
+    monkeypatch.setattr(Client, "request", client_request)
+    rate_limiter = MagicMock()
+    client = RateLimitedClient(auth="token", rate_limiter=rate_limiter)
+
+    response = client.request("pages/page-id", "GET", query={"filter": "value"})
+
+    assert response == "response"
+    assert rate_limiter.acquire.call_count == client_request.call_count
+    client_request.assert_called_with("pages/page-id", "GET", query={"filter": "value"})
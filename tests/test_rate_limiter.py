@@ -0,0 +1,65 @@
+"""Tests for the rate_limiter module."""
+
+from __future__ import annotations
+
+import pytest
+
+from musicbrainz2notion.rate_limiter import SlidingWindowRateLimiter
+
+
+class FakeClock:
+    """Clock advancing only when sleeping."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr("musicbrainz2notion.rate_limiter.time", clock)
+    return clock
+
+
+def test_calls_within_limit_dont_wait(clock: FakeClock) -> None:
+    rate_limiter = SlidingWindowRateLimiter(interval=1, max_calls=3)
+
+    for _ in range(3):
+        rate_limiter.acquire()
+
+    assert clock.sleeps == []
+
+
+def test_call_over_limit_waits_for_window(clock: FakeClock) -> None:
+    rate_limiter = SlidingWindowRateLimiter(interval=1, max_calls=3)
+
+    rate_limiter.acquire()
+    clock.now = 0.25
+    rate_limiter.acquire()
+    rate_limiter.acquire()
+    rate_limiter.acquire()
+
+    # The fourth call waits for the first one to leave the window
+    assert clock.sleeps == [0.75]
+    assert clock.now == 1.0
+
+
+def test_window_slides(clock: FakeClock) -> None:
+    rate_limiter = SlidingWindowRateLimiter(interval=1, max_calls=2)
+
+    rate_limiter.acquire()
+    clock.now = 0.5
+    rate_limiter.acquire()
+    clock.now = 1.25
+    rate_limiter.acquire()  # The first call left the window
+    rate_limiter.acquire()  # Waits for the second call to leave the window
+
+    assert clock.sleeps == [0.25]
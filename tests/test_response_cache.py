@@ -0,0 +1,99 @@
+"""Tests for the response_cache module."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from musicbrainz2notion.response_cache import ResponseCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+EXPIRE_AFTER = timedelta(hours=1)
+
+
+class FakeClock:
+    """Clock only advancing when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr("musicbrainz2notion.response_cache.time", clock)
+    return clock
+
+
+@pytest.fixture
+def cache_path(tmp_path: Path) -> Path:
+    return tmp_path / "cache" / "responses.sqlite"
+
+
+@pytest.mark.usefixtures("clock")
+def test_set_and_get(cache_path: Path) -> None:
+    cache = ResponseCache(cache_path, expire_after=EXPIRE_AFTER)
+    response = {"artist": {"id": "mbid", "tag-list": [{"name": "rock", "count": "3"}]}}
+
+    cache.set("artist/mbid", response)
+
+    assert cache.get("artist/mbid") == response
+    assert cache.get("artist/other-mbid") is None
+    # The responses are kept on disk between runs
+    assert ResponseCache(cache_path, expire_after=EXPIRE_AFTER).get("artist/mbid") == response
+
+
+def test_expired_response_missing(cache_path: Path, clock: FakeClock) -> None:
+    cache = ResponseCache(cache_path, expire_after=EXPIRE_AFTER)
+    cache.set("artist/mbid", "response")
+
+    clock.now += EXPIRE_AFTER.total_seconds()
+    assert cache.get("artist/mbid") == "response"
+
+    clock.now += 1
+    assert cache.get("artist/mbid") is None
+
+
+def test_prune_expired(cache_path: Path, clock: FakeClock) -> None:
+    cache = ResponseCache(cache_path, expire_after=EXPIRE_AFTER)
+    cache.set("artist/old-mbid", "old response")
+    clock.now += EXPIRE_AFTER.total_seconds() + 1
+    cache.set("artist/new-mbid", "new response")
+
+    cache.prune_expired()
+
+    # Even with a longer expiration, the pruned response is gone
+    longer_cache = ResponseCache(cache_path, expire_after=2 * EXPIRE_AFTER)
+    assert longer_cache.get("artist/old-mbid") is None
+    assert longer_cache.get("artist/new-mbid") == "new response"
+
+
+@pytest.mark.usefixtures("clock")
+def test_clear(cache_path: Path) -> None:
+    cache = ResponseCache(cache_path, expire_after=EXPIRE_AFTER)
+    cache.set("artist/mbid-1", "response 1")
+    cache.set("artist/mbid-2", "response 2")
+
+    cache.clear()
+
+    assert cache.get("artist/mbid-1") is None
+    assert cache.get("artist/mbid-2") is None
+
+
+def test_make_key_ignores_argument_order() -> None:
+    key = ResponseCache.make_key("artist/mbid", {"inc": "tags", "fmt": "json"})
+
+    assert key == ResponseCache.make_key("artist/mbid", {"fmt": "json", "inc": "tags"})
+    assert key == "artist/mbid?fmt=json&inc=tags"
+    assert key != ResponseCache.make_key("artist/mbid", {"inc": "ratings", "fmt": "json"})
+
+
+def test_make_key_without_arguments() -> None:
+    assert ResponseCache.make_key("artist/mbid", None) == ResponseCache.make_key("artist/mbid", {})